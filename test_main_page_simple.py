@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+主页面简单测试
+"""
+import ast
+import inspect
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from xray_gui.ui.widgets import main_page
+from xray_gui.ui.widgets.main_page import MainPage
+
+
+def _app():
+    # 保留模块级引用，避免 QApplication 被回收
+    global _qt_app
+    _qt_app = QApplication.instance() or QApplication([])
+    return _qt_app
+
+
+def test_control_bar_defined_once():
+    """测试控制栏只定义一次（重复定义会静默覆盖增强版）"""
+    tree = ast.parse(inspect.getsource(main_page))
+    class_def = next(
+        node for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == "MainPage"
+    )
+    names = [
+        node.name for node in class_def.body
+        if isinstance(node, ast.FunctionDef)
+    ]
+    assert names.count("_create_control_bar") == 1
+
+    print("✅ 控制栏定义测试通过")
+
+
+def test_no_graphics_effects():
+    """测试主页面不使用图形效果（阴影会让控件走软件渲染）"""
+    tree = ast.parse(inspect.getsource(main_page))
+    names = {
+        node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+    } | {
+        alias.name for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) for alias in node.names
+    }
+    assert "QGraphicsDropShadowEffect" not in names
+    assert "setGraphicsEffect" not in {
+        node.attr for node in ast.walk(tree) if isinstance(node, ast.Attribute)
+    }
+
+    print("✅ 图形效果检查通过")
+
+
+def test_main_page_builds_enhanced_control_bar():
+    """测试主页面构建增强版控制栏"""
+    _app()
+    page = MainPage()
+    try:
+        assert page.test_btn.text() == "⚡ 智能测速"
+        assert page.cancel_test_btn.isHidden()
+    finally:
+        page.cleanup()
+
+    print("✅ 主页面构建测试通过")
+
+
+if __name__ == "__main__":
+    test_control_bar_defined_once()
+    test_no_graphics_effects()
+    test_main_page_builds_enhanced_control_bar()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+节点表（列式存储）测试
+"""
+from xray_gui.core.node import Node
+from xray_gui.core.node_table import NodeTable
+
+
+def _make_nodes():
+    return [
+        Node(uuid="uuid-1", address="1.1.1.1", port=443, remark="HK 01", protocol="vless"),
+        Node(uuid="uuid-1", address="2.2.2.2", port=8443, remark="JP 01", protocol="VMess"),
+        Node(uuid="uuid-2", address="3.3.3.3", port=80, remark="US 01", protocol="vless"),
+    ]
+
+
+def test_node_table_columns():
+    """测试节点表各列与节点一一对应"""
+    nodes = _make_nodes()
+    table = NodeTable.from_nodes(nodes)
+    
+    assert len(table) == 3, "节点表长度应与节点数一致"
+    assert table.nodes == nodes and table.nodes is not nodes, "节点表应持有节点列表的副本"
+    assert table.remarks == ["HK 01", "JP 01", "US 01"]
+    assert table.addresses == ["1.1.1.1", "2.2.2.2", "3.3.3.3"]
+    assert table.ports == [443, 8443, 80]
+    assert table.protocols == ["vless", "vmess", "vless"], "协议列应统一为小写"
+    assert table.protocol_stats() == {"vless": 2, "vmess": 1}
+    
+    print("✅ 节点表列构建测试通过")
+
+
+def test_node_table_refresh_dynamic():
+    """测试延迟和本地端口列的刷新"""
+    nodes = _make_nodes()
+    table = NodeTable.from_nodes(nodes)
+    assert table.latencies == [None, None, None]
+    
+    nodes[0].latency = 120
+    nodes[2].local_port = 10002
+    table.refresh_dynamic()
+    
+    assert table.latencies == [120, None, None]
+    assert table.latency_displays == ["120ms", "未测试", "未测试"]
+    assert table.latency_levels == [3, 0, 0]
+    assert table.local_ports == [None, None, 10002]
+    
+    nodes[1].latency = -1
+    table.refresh_row(1)
+    assert table.latencies == [120, -1, None]
+    assert table.latency_levels == [3, 1, 0]
+    
+    empty = NodeTable()
+    assert len(empty) == 0 and empty.protocol_stats() == {}
+    
+    print("✅ 节点表动态列刷新测试通过")
+
+
+if __name__ == "__main__":
+    test_node_table_columns()
+    test_node_table_refresh_dynamic()
@@ -1,7 +1,7 @@
 """
 过滤引擎 - 根据关键词过滤节点
 """
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from .node import Node
 
 
@@ -114,3 +114,73 @@ class FilterEngine:
                     break
         
         return filtered
+    
+    @staticmethod
+    def match_indices(remarks_lower: List[str], keyword: str,
+                      candidates: Optional[List[int]] = None) -> List[int]:
+        """
+        查找名称包含关键词的节点索引
+        
+        Args:
+            remarks_lower: 预先转为小写的节点名称列表
+            keyword: 搜索关键词
+            candidates: 只在这些索引中查找（如上一次较短关键词的结果）
+            
+        Returns:
+            匹配的节点索引列表
+        """
+        if not keyword:
+            return list(range(len(remarks_lower)))
+        keyword = keyword.lower()
+        if candidates is not None:
+            return [i for i in candidates if keyword in remarks_lower[i]]
+        return [i for i, remark in enumerate(remarks_lower) if keyword in remark]
+    
+    @staticmethod
+    def build_ngram_index(remarks_lower: List[str], n: int = 3) -> Dict[str, Set[int]]:
+        """
+        构建 n-gram 倒排索引
+        
+        Args:
+            remarks_lower: 预先转为小写的节点名称列表
+            n: 片段长度
+            
+        Returns:
+            长度为 n 的名称片段到包含它的节点索引集合的映射
+        """
+        index: Dict[str, Set[int]] = {}
+        for i, remark in enumerate(remarks_lower):
+            for gram in {remark[j:j + n] for j in range(len(remark) - n + 1)}:
+                index.setdefault(gram, set()).add(i)
+        return index
+    
+    @staticmethod
+    def ngram_candidates(index: Dict[str, Set[int]], keyword: str,
+                         n: int = 3) -> Optional[List[int]]:
+        """
+        通过 n-gram 索引查找可能包含关键词的节点索引
+        
+        结果包含关键词的全部片段，但片段位置不一定连续，仍需用
+        match_indices 校验。
+        
+        Args:
+            index: build_ngram_index 构建的索引
+            keyword: 搜索关键词（小写）
+            n: 片段长度，需与构建索引时一致
+            
+        Returns:
+            升序的候选索引列表；关键词短于 n 时返回 None，表示无法使用索引
+        """
+        if len(keyword) < n:
+            return None
+        # 从最小的集合开始求交集
+        groups = sorted(
+            (index.get(keyword[j:j + n], set()) for j in range(len(keyword) - n + 1)),
+            key=len
+        )
+        candidates = set(groups[0])
+        for group in groups[1:]:
+            if not candidates:
+                break
+            candidates &= group
+        return sorted(candidates)
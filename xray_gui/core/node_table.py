@@ -0,0 +1,101 @@
+"""
+节点表 - 节点列表的列式存储（Struct-of-Arrays）
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from .node import Node
+
+
+def latency_level(latency: Optional[int]) -> int:
+    """
+    延迟等级，用于界面按等级查表取颜色
+
+    Returns:
+        0 未测试、1 超时、2 小于 100ms、3 小于 300ms、4 其他
+    """
+    if latency is None:
+        return 0
+    if latency == -1:
+        return 1
+    if latency < 100:
+        return 2
+    if latency < 300:
+        return 3
+    return 4
+
+
+@dataclass
+class NodeTable:
+    """
+    按列保存节点字段的并行列表
+
+    界面的统计、过滤和表格渲染按行号直接索引这些列表，
+    避免在热路径上逐个访问 Node 对象的属性。Node 对象本身仍保留在
+    nodes 中，用于信号传递等需要完整节点的场合。
+    """
+    nodes: List[Node] = field(default_factory=list)
+    uuids: List[str] = field(default_factory=list)
+    remarks: List[str] = field(default_factory=list)
+    addresses: List[str] = field(default_factory=list)
+    ports: List[int] = field(default_factory=list)
+    protocols: List[str] = field(default_factory=list)
+    local_ports: List[Optional[int]] = field(default_factory=list)
+    latencies: List[Optional[int]] = field(default_factory=list)
+    latency_displays: List[str] = field(default_factory=list)
+    latency_levels: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_nodes(cls, nodes: List[Node]) -> 'NodeTable':
+        """
+        从节点列表构建节点表
+
+        Args:
+            nodes: 节点列表
+
+        Returns:
+            节点表
+        """
+        nodes = list(nodes)
+        return cls(
+            nodes=nodes,
+            uuids=[n.uuid for n in nodes],
+            remarks=[n.remark for n in nodes],
+            addresses=[n.address for n in nodes],
+            ports=[n.port for n in nodes],
+            protocols=[n.protocol.lower() for n in nodes],
+            local_ports=[n.local_port for n in nodes],
+            latencies=[n.latency for n in nodes],
+            latency_displays=[n.latency_display for n in nodes],
+            latency_levels=[latency_level(n.latency) for n in nodes],
+        )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def refresh_dynamic(self) -> None:
+        """重新读取会在运行中变化的列（本地端口、延迟）"""
+        nodes = self.nodes
+        self.local_ports = [n.local_port for n in nodes]
+        self.latencies = [n.latency for n in nodes]
+        self.latency_displays = [n.latency_display for n in nodes]
+        self.latency_levels = [latency_level(latency) for latency in self.latencies]
+
+    def refresh_row(self, i: int) -> None:
+        """只重新读取第 i 个节点会变化的列，单个节点更新时使用"""
+        node = self.nodes[i]
+        self.local_ports[i] = node.local_port
+        self.latencies[i] = node.latency
+        self.latency_displays[i] = node.latency_display
+        self.latency_levels[i] = latency_level(node.latency)
+
+    def protocol_stats(self) -> Dict[str, int]:
+        """
+        统计各协议的节点数量
+
+        Returns:
+            协议名（小写）到节点数量的映射
+        """
+        stats: Dict[str, int] = {}
+        for protocol in self.protocols:
+            stats[protocol] = stats.get(protocol, 0) + 1
+        return stats
@@ -106,6 +106,7 @@ class SystemAdaptabilityManager:
         # 监控线程
         self._monitoring_thread: Optional[threading.Thread] = None
         self._stop_monitoring = threading.Event()
+        self._monitoring_paused = threading.Event()  # 暂停时线程保留，但跳过检测
         self._monitoring_interval = 5.0  # 监控间隔（秒）
         
         # 事件回调
@@ -149,6 +150,14 @@ class SystemAdaptabilityManager:
         
         self.logger.info("System adaptability monitoring stopped")
     
+    def pause_monitoring(self):
+        """暂停系统监控（不等待监控线程，当前一轮检测结束后生效）"""
+        self._monitoring_paused.set()
+    
+    def resume_monitoring(self):
+        """恢复系统监控"""
+        self._monitoring_paused.clear()
+    
     def register_event_callback(self, event_type: SystemEvent, callback: Callable[[SystemState], None]):
         """注册事件回调"""
         if event_type not in self._event_callbacks:
@@ -192,6 +201,8 @@ class SystemAdaptabilityManager:
     def _monitoring_loop(self):
         """监控循环"""
         while not self._stop_monitoring.wait(self._monitoring_interval):
+            if self._monitoring_paused.is_set():
+                continue
             try:
                 self._update_system_state()
                 self._detect_changes()
@@ -1 +1,27 @@
 # 样式模块
+import functools
+from pathlib import Path
+
+from PyQt6.QtWidgets import QApplication
+
+STYLES_DIR = Path(__file__).parent
+
+# 已安装到应用级样式表的样式名
+_installed = set()
+
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet(name: str) -> str:
+    """读取样式表文件（只读取一次）"""
+    return (STYLES_DIR / f"{name}.qss").read_text(encoding="utf-8")
+
+
+def install_stylesheet(name: str):
+    """将样式表追加到应用级样式表，所有控件共享同一份已解析的规则"""
+    if name in _installed:
+        return
+    app = QApplication.instance()
+    if app is None:
+        return
+    _installed.add(name)
+    app.setStyleSheet(app.styleSheet() + "\n" + load_stylesheet(name))
@@ -0,0 +1,116 @@
+"""
+轻量进度条组件 - 替代带渐变样式的 QProgressBar
+"""
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QVariantAnimation
+from PyQt6.QtGui import QPainter, QLinearGradient, QColor, QPixmap
+
+
+class BusyBar(QWidget):
+    """
+    细进度条
+
+    渐变色块只在尺寸变化时渲染成 QPixmap，之后每帧只做一次 drawPixmap。
+    最大值为 0 时为忙碌状态（色块循环移动，仅在可见时运行动画），
+    否则按 value / maximum 显示进度。接口与 QProgressBar 的常用部分一致。
+    """
+
+    BACKGROUND = QColor(40, 30, 60, 128)
+    CHUNK_START = QColor("#7800ff")
+    CHUNK_END = QColor("#00d4ff")
+
+    # 忙碌状态下色块占总宽度的比例、循环一次的时长（毫秒）
+    BUSY_CHUNK_RATIO = 0.3
+    BUSY_CYCLE_MS = 1200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._minimum = 0
+        self._maximum = 0
+        self._value = 0
+        self._chunk = QPixmap()
+        self._offset = 0.0
+
+        self._anim = QVariantAnimation(self)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(1.0)
+        self._anim.setDuration(self.BUSY_CYCLE_MS)
+        self._anim.setLoopCount(-1)
+        self._anim.valueChanged.connect(self._on_anim)
+
+    def setRange(self, minimum: int, maximum: int):
+        """设置范围，最大值为 0 时进入忙碌状态"""
+        self._minimum = minimum
+        self._maximum = maximum
+        self._sync_anim()
+        self.update()
+
+    def setMaximum(self, maximum: int):
+        """设置最大值"""
+        self.setRange(self._minimum, maximum)
+
+    def setValue(self, value: int):
+        """设置当前值"""
+        if value != self._value:
+            self._value = value
+            self.update()
+
+    def _is_busy(self) -> bool:
+        return self._maximum <= self._minimum
+
+    def _sync_anim(self):
+        """只在可见且处于忙碌状态时运行动画"""
+        if self.isVisible() and self._is_busy():
+            if self._anim.state() != QVariantAnimation.State.Running:
+                self._anim.start()
+        else:
+            self._anim.stop()
+
+    def _on_anim(self, value):
+        self._offset = value
+        self.update()
+
+    def _render_chunk(self):
+        """按当前尺寸渲染渐变色块"""
+        width = max(1, self.width())
+        height = max(1, self.height())
+        self._chunk = QPixmap(width, height)
+        self._chunk.fill(Qt.GlobalColor.transparent)
+        gradient = QLinearGradient(0, 0, width, 0)
+        gradient.setColorAt(0, self.CHUNK_START)
+        gradient.setColorAt(1, self.CHUNK_END)
+        painter = QPainter(self._chunk)
+        painter.fillRect(0, 0, width, height, gradient)
+        painter.end()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_anim()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._anim.stop()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._render_chunk()
+
+    def paintEvent(self, event):
+        """绘制背景和色块"""
+        if self._chunk.isNull():
+            self._render_chunk()
+        width = self.width()
+        height = self.height()
+        painter = QPainter(self)
+        painter.fillRect(0, 0, width, height, self.BACKGROUND)
+        if self._is_busy():
+            chunk_width = int(width * self.BUSY_CHUNK_RATIO)
+            x = int((width + chunk_width) * self._offset) - chunk_width
+            painter.drawPixmap(x, 0, self._chunk, 0, 0, chunk_width, height)
+        else:
+            span = self._maximum - self._minimum
+            ratio = min(max((self._value - self._minimum) / span, 0.0), 1.0)
+            fill_width = int(width * ratio)
+            if fill_width > 0:
+                painter.drawPixmap(0, 0, self._chunk, 0, 0, fill_width, height)
+        painter.end()
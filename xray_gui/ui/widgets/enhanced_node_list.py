@@ -3,331 +3,94 @@
 Feature: xray-protocol-enhancement, Requirements 1.1-1.8, 2.1-2.5
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QProgressBar, QToolTip, QMenu
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QApplication,
+    QTableView, QFrame, QProgressBar, QToolTip, QMenu
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QColor, QPalette, QAction, QPixmap, QPainter
+from PyQt6.QtCore import Qt, QPoint, QModelIndex, pyqtSignal, pyqtSlot, QTimer, QPropertyAnimation, QEasingCurve
+from PyQt6.QtGui import QFont, QColor, QPalette, QAction
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+import functools
 
+from .node_list import NodeTableModel, setup_node_table_view
 from ...core.node import Node
-from ...core.ui_integration_manager import UIIntegrationManager, UIUpdateType, UIUpdateData, ProtocolDisplayInfo
+from ...core.node_table import NodeTable
+from ...core.ui_integration_manager import UIIntegrationManager, UIUpdateType, UIUpdateData
 
 
-class ProtocolBadge(QLabel):
-    """协议标识组件"""
-    
-    def __init__(self, protocol_info: ProtocolDisplayInfo, parent=None):
-        super().__init__(parent)
-        self.protocol_info = protocol_info
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """设置UI"""
-        self.setText(self.protocol_info.display_name)
-        self.setFixedSize(60, 20)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # 设置样式
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.protocol_info.color};
-                color: white;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-                padding: 2px 6px;
-            }}
-        """)
-        
-        # 设置工具提示
-        tooltip_text = f"""
-        <b>{self.protocol_info.display_name}</b><br>
-        {self.protocol_info.description}<br><br>
-        <b>支持特性:</b><br>
-        {'<br>'.join(['• ' + feature for feature in self.protocol_info.supported_features])}
-        """
-        self.setToolTip(tooltip_text)
+# 浅色背景下的延迟颜色：未测试、超时、<100ms、<300ms、其他
+_LATENCY_COLORS = (
+    QColor("#9E9E9E"),
+    QColor("#F44336"),
+    QColor("#4CAF50"),
+    QColor("#FF9800"),
+    QColor("#FF5722"),
+)
 
+# 节点表格样式表
+_NODE_TABLE_QSS = """
+    QTableView {
+        background-color: #FFFFFF;
+        alternate-background-color: #FAFAFA;
+        border: 1px solid #E0E0E0;
+        border-radius: 8px;
+        color: #333333;
+    }
+    QTableView::item:selected {
+        background-color: #E3F2FD;
+        color: #333333;
+    }
+    QHeaderView::section {
+        background-color: #F5F5F5;
+        color: #666666;
+        padding: 6px;
+        border: none;
+        border-bottom: 1px solid #E0E0E0;
+        font-weight: bold;
+    }
+"""
 
-class LatencyIndicator(QLabel):
-    """延迟指示器"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.latency = None
-        self._setup_ui()
-    
-    def _setup_ui(self):
-        """设置UI"""
-        self.setFixedSize(60, 20)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.update_latency(None)
-    
-    def update_latency(self, latency: Optional[int]):
-        """更新延迟显示"""
-        self.latency = latency
-        
-        if latency is None:
-            self.setText("未测试")
-            color = "#9E9E9E"
-            text_color = "white"
-        elif latency == -1:
-            self.setText("超时")
-            color = "#F44336"
-            text_color = "white"
-        elif latency < 100:
-            self.setText(f"{latency}ms")
-            color = "#4CAF50"
-            text_color = "white"
-        elif latency < 300:
-            self.setText(f"{latency}ms")
-            color = "#FF9800"
-            text_color = "white"
-        else:
-            self.setText(f"{latency}ms")
-            color = "#F44336"
-            text_color = "white"
-        
-        self.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                color: {text_color};
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-                padding: 2px 6px;
-            }}
-        """)
 
-
-class NodeItem(QFrame):
-    """节点项组件"""
-    
-    node_selected = pyqtSignal(Node)
-    test_requested = pyqtSignal(Node)
-    
-    def __init__(self, node: Node, protocol_info: ProtocolDisplayInfo, parent=None):
-        super().__init__(parent)
-        self.node = node
-        self.protocol_info = protocol_info
-        self.selected = False
-        self._setup_ui()
-        self._setup_context_menu()
-    
-    def _setup_ui(self):
-        """设置UI"""
-        self.setFrameStyle(QFrame.Shape.Box)
-        self.setFixedHeight(80)
-        self.setStyleSheet("""
-            QFrame {
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-                background-color: white;
-                margin: 2px;
-            }
-            QFrame:hover {
-                border-color: #2196F3;
-                background-color: #F5F5F5;
-            }
-        """)
-        
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(12)
-        
-        # 左侧：协议标识和节点信息
-        left_layout = QVBoxLayout()
-        left_layout.setSpacing(4)
-        
-        # 节点名称和协议标识
-        name_protocol_layout = QHBoxLayout()
-        name_protocol_layout.setSpacing(8)
-        
-        # 节点名称
-        self.name_label = QLabel(self.node.remark or "未命名节点")
-        self.name_label.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        name_protocol_layout.addWidget(self.name_label)
-        
-        # 协议标识
-        self.protocol_badge = ProtocolBadge(self.protocol_info)
-        name_protocol_layout.addWidget(self.protocol_badge)
-        
-        name_protocol_layout.addStretch()
-        left_layout.addLayout(name_protocol_layout)
-        
-        # 节点地址和端口
-        address_text = f"{self.node.address}:{self.node.port}"
-        self.address_label = QLabel(address_text)
-        self.address_label.setFont(QFont("Consolas", 9))
-        self.address_label.setStyleSheet("color: #666666;")
-        left_layout.addWidget(self.address_label)
-        
-        layout.addLayout(left_layout)
-        
-        # 中间：延迟信息
-        middle_layout = QVBoxLayout()
-        middle_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        latency_label = QLabel("延迟")
-        latency_label.setFont(QFont("Arial", 9))
-        latency_label.setStyleSheet("color: #666666;")
-        latency_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        middle_layout.addWidget(latency_label)
-        
-        self.latency_indicator = LatencyIndicator()
-        middle_layout.addWidget(self.latency_indicator)
-        
-        layout.addLayout(middle_layout)
-        
-        # 右侧：端口信息和操作按钮
-        right_layout = QVBoxLayout()
-        right_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # 本地端口
-        if hasattr(self.node, 'local_port') and self.node.local_port:
-            port_text = f"本地端口: {self.node.local_port}"
-        else:
-            port_text = "未分配端口"
-        
-        self.port_label = QLabel(port_text)
-        self.port_label.setFont(QFont("Arial", 9))
-        self.port_label.setStyleSheet("color: #666666;")
-        self.port_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        right_layout.addWidget(self.port_label)
-        
-        # 测试按钮
-        self.test_button = QPushButton("测试")
-        self.test_button.setFixedSize(50, 25)
-        self.test_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 12px;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-        """)
-        self.test_button.clicked.connect(lambda: self.test_requested.emit(self.node))
-        right_layout.addWidget(self.test_button)
-        
-        layout.addLayout(right_layout)
-        
-        # 更新延迟显示
-        self.update_latency()
-    
-    def _setup_context_menu(self):
-        """设置右键菜单"""
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._show_context_menu)
-    
-    def _show_context_menu(self, position):
-        """显示右键菜单"""
-        menu = QMenu(self)
-        
-        # 复制节点信息
-        copy_action = QAction("复制节点信息", self)
-        copy_action.triggered.connect(self._copy_node_info)
-        menu.addAction(copy_action)
-        
-        # 复制地址
-        copy_address_action = QAction("复制地址", self)
-        copy_address_action.triggered.connect(self._copy_address)
-        menu.addAction(copy_address_action)
-        
-        menu.addSeparator()
-        
-        # 测试延迟
-        test_action = QAction("测试延迟", self)
-        test_action.triggered.connect(lambda: self.test_requested.emit(self.node))
-        menu.addAction(test_action)
-        
-        menu.exec(self.mapToGlobal(position))
-    
-    def _copy_node_info(self):
-        """复制节点信息"""
-        from PyQt6.QtWidgets import QApplication
-        
-        info_text = f"""节点名称: {self.node.remark}
-协议: {self.node.protocol}
-地址: {self.node.address}
-端口: {self.node.port}
-本地端口: {getattr(self.node, 'local_port', '未分配')}
-延迟: {self.node.latency if self.node.latency else '未测试'}ms"""
-        
-        QApplication.clipboard().setText(info_text)
-    
-    def _copy_address(self):
-        """复制地址"""
-        from PyQt6.QtWidgets import QApplication
-        QApplication.clipboard().setText(f"{self.node.address}:{self.node.port}")
-    
-    def update_latency(self):
-        """更新延迟显示"""
-        latency = getattr(self.node, 'latency', None)
-        self.latency_indicator.update_latency(latency)
-    
-    def update_port(self):
-        """更新端口显示"""
-        if hasattr(self.node, 'local_port') and self.node.local_port:
-            port_text = f"本地端口: {self.node.local_port}"
-        else:
-            port_text = "未分配端口"
-        self.port_label.setText(port_text)
-    
-    def set_selected(self, selected: bool):
-        """设置选中状态"""
-        self.selected = selected
-        if selected:
-            self.setStyleSheet("""
-                QFrame {
-                    border: 2px solid #2196F3;
-                    border-radius: 8px;
-                    background-color: #E3F2FD;
-                    margin: 2px;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QFrame {
-                    border: 1px solid #E0E0E0;
-                    border-radius: 8px;
-                    background-color: white;
-                    margin: 2px;
-                }
-                QFrame:hover {
-                    border-color: #2196F3;
-                    background-color: #F5F5F5;
-                }
-            """)
-    
-    def mousePressEvent(self, event):
-        """鼠标点击事件"""
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.node_selected.emit(self.node)
-        super().mousePressEvent(event)
+@functools.lru_cache(maxsize=16)
+def _palette_for(color_hex: str) -> QPalette:
+    """按文字颜色缓存调色板，替代逐个控件的 color 样式表"""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(color_hex))
+    return palette
 
 
 class EnhancedNodeList(QWidget):
     """增强的节点列表组件"""
     
     node_selected = pyqtSignal(Node)
-    nodes_test_requested = pyqtSignal(list)
+    nodes_test_requested = pyqtSignal(tuple)  # 以元组传递，避免转换为 QVariantList
     single_node_test_requested = pyqtSignal(Node)
     
+    # 进度刷新间隔（毫秒），约 20Hz
+    PROGRESS_FLUSH_INTERVAL = 50
+    
+    # UI集成管理器回调转发信号（回调可能来自测试线程，经队列连接回到UI线程）
+    _node_list_refresh = pyqtSignal(UIUpdateData)
+    _latency_test_progress = pyqtSignal(UIUpdateData)
+    _latency_test_complete = pyqtSignal(UIUpdateData)
+    _tun_mode_status = pyqtSignal(UIUpdateData)
+    _port_allocation_update = pyqtSignal(UIUpdateData)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.ui_manager = UIIntegrationManager()
         self.nodes: List[Node] = []
-        self.node_items: List[NodeItem] = []
+        self.node_table = NodeTable()
         self.selected_nodes: List[Node] = []
+        
+        # 延迟测试进度合并刷新
+        self._progress_pending: Optional[Dict[str, Any]] = None
+        self._progress_active = False
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_FLUSH_INTERVAL)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         self._setup_ui()
         self._setup_ui_callbacks()
     
@@ -340,25 +103,18 @@ class EnhancedNodeList(QWidget):
         # 顶部工具栏
         self._create_toolbar(layout)
         
-        # 节点列表区域
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-        
-        self.scroll_widget = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_widget)
-        self.scroll_layout.setContentsMargins(0, 0, 0, 0)
-        self.scroll_layout.setSpacing(4)
-        self.scroll_layout.addStretch()
-        
-        self.scroll_area.setWidget(self.scroll_widget)
-        layout.addWidget(self.scroll_area)
+        # 节点表格：视图只绘制可见行，单元格文本由模型按需生成
+        self.table = QTableView()
+        self._model = NodeTableModel(self, _LATENCY_COLORS)
+        self.table.setModel(self._model)
+        setup_node_table_view(self.table)
+        self.table.setStyleSheet(_NODE_TABLE_QSS)
+        self.table.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_context_menu)
+        self._setup_context_menu()
+        layout.addWidget(self.table)
         
         # 底部状态栏
         self._create_status_bar(layout)
@@ -382,7 +138,7 @@ class EnhancedNodeList(QWidget):
         # 节点统计
         self.stats_label = QLabel("节点: 0 | 协议: 0")
         self.stats_label.setFont(QFont("Arial", 10))
-        self.stats_label.setStyleSheet("color: #666666;")
+        self.stats_label.setPalette(_palette_for("#666666"))
         toolbar_layout.addWidget(self.stats_label)
         
         toolbar_layout.addStretch()
@@ -440,9 +196,16 @@ class EnhancedNodeList(QWidget):
         # 状态文本
         self.status_label = QLabel("就绪")
         self.status_label.setFont(QFont("Arial", 9))
-        self.status_label.setStyleSheet("color: #666666;")
+        self.status_label.setPalette(_palette_for("#666666"))
         status_layout.addWidget(self.status_label)
         
+        # 测试进度计数（测试期间状态文本固定，仅刷新该计数）
+        self.status_counter = QLabel()
+        self.status_counter.setFont(QFont("Arial", 9))
+        self.status_counter.setPalette(_palette_for("#666666"))
+        self.status_counter.setVisible(False)
+        status_layout.addWidget(self.status_counter)
+        
         status_layout.addStretch()
         
         # 进度条（默认隐藏）
@@ -467,53 +230,114 @@ class EnhancedNodeList(QWidget):
     
     def _setup_ui_callbacks(self):
         """设置UI回调"""
-        # 注册UI更新回调
-        self.ui_manager.register_ui_callback(UIUpdateType.NODE_LIST_REFRESH, self._on_node_list_update)
-        self.ui_manager.register_ui_callback(UIUpdateType.LATENCY_TEST_PROGRESS, self._on_latency_progress)
-        self.ui_manager.register_ui_callback(UIUpdateType.LATENCY_TEST_COMPLETE, self._on_latency_complete)
-        self.ui_manager.register_ui_callback(UIUpdateType.TUN_MODE_STATUS, self._on_tun_status_update)
-        self.ui_manager.register_ui_callback(UIUpdateType.PORT_ALLOCATION_UPDATE, self._on_port_allocation_update)
+        # 注册UI更新回调：管理器回调只负责发射信号，处理函数以队列连接在UI线程执行
+        signal_slots = [
+            (UIUpdateType.NODE_LIST_REFRESH, self._node_list_refresh, self._on_node_list_update),
+            (UIUpdateType.LATENCY_TEST_PROGRESS, self._latency_test_progress, self._on_latency_progress),
+            (UIUpdateType.LATENCY_TEST_COMPLETE, self._latency_test_complete, self._on_latency_complete),
+            (UIUpdateType.TUN_MODE_STATUS, self._tun_mode_status, self._on_tun_status_update),
+            (UIUpdateType.PORT_ALLOCATION_UPDATE, self._port_allocation_update, self._on_port_allocation_update),
+        ]
+        for update_type, signal, slot in signal_slots:
+            signal.connect(slot, Qt.ConnectionType.QueuedConnection)
+            self.ui_manager.register_ui_callback(update_type, signal.emit)
     
     def update_nodes(self, nodes: List[Node]):
         """更新节点列表"""
-        self.nodes = nodes.copy()
+        self.node_table = NodeTable.from_nodes(nodes)
+        self.nodes = self.node_table.nodes
         self._refresh_node_items()
         
         # 通知UI管理器
         self.ui_manager.update_node_list(nodes)
     
     def _refresh_node_items(self):
-        """刷新节点项"""
-        # 清除现有项
-        for item in self.node_items:
-            item.setParent(None)
-        self.node_items.clear()
-        
-        # 创建新项
-        for node in self.nodes:
-            protocol_info = self.ui_manager.get_protocol_display_info(node.protocol)
-            if protocol_info:
-                item = NodeItem(node, protocol_info)
-                item.node_selected.connect(self._on_node_selected)
-                item.test_requested.connect(self.single_node_test_requested.emit)
-                
-                # 插入到布局中（在stretch之前）
-                self.scroll_layout.insertWidget(self.scroll_layout.count() - 1, item)
-                self.node_items.append(item)
+        """刷新节点表格（模型与当前显示的行比对，只增删发生变化的行）"""
+        # 每种协议只查询一次显示信息，不支持显示的协议不列出
+        table = self.node_table
+        displayable = {
+            protocol
+            for protocol in set(table.protocols)
+            if self.ui_manager.get_protocol_display_info(protocol)
+        }
+        indices = [i for i, protocol in enumerate(table.protocols) if protocol in displayable]
+        self._model.set_nodes(table, indices)
+    
+    def _setup_context_menu(self):
+        """设置右键菜单（只构建一次）"""
+        self._ctx_menu = QMenu(self)
+        
+        # 复制节点信息
+        copy_action = QAction("复制节点信息", self)
+        copy_action.triggered.connect(self._copy_node_info)
+        self._ctx_menu.addAction(copy_action)
+        
+        # 复制地址
+        copy_address_action = QAction("复制地址", self)
+        copy_address_action.triggered.connect(self._copy_address)
+        self._ctx_menu.addAction(copy_address_action)
+        
+        self._ctx_menu.addSeparator()
+        
+        # 测试延迟
+        test_action = QAction("测试延迟", self)
+        test_action.triggered.connect(self._emit_test)
+        self._ctx_menu.addAction(test_action)
+    
+    def _show_context_menu(self, position: QPoint):
+        """显示右键菜单（仅在节点行上）"""
+        if self.table.indexAt(position).isValid():
+            self._ctx_menu.exec(self.table.viewport().mapToGlobal(position))
+    
+    def _current_node(self) -> Optional[Node]:
+        """获取当前行的节点"""
+        index = self.table.currentIndex()
+        if not index.isValid():
+            return None
+        return self._model.node_at(index.row())
+    
+    def _emit_test(self):
+        """请求测试当前节点"""
+        node = self._current_node()
+        if node:
+            self.single_node_test_requested.emit(node)
+    
+    def _copy_node_info(self):
+        """复制节点信息"""
+        node = self._current_node()
+        if not node:
+            return
+        info_text = f"""节点名称: {node.remark}
+协议: {node.protocol}
+地址: {node.address}
+端口: {node.port}
+本地端口: {node.local_port or '未分配'}
+延迟: {node.latency if node.latency else '未测试'}ms"""
+        
+        QApplication.clipboard().setText(info_text)
+    
+    def _copy_address(self):
+        """复制地址"""
+        node = self._current_node()
+        if node:
+            QApplication.clipboard().setText(f"{node.address}:{node.port}")
     
     def _test_all_nodes(self):
         """测试所有节点"""
         if self.nodes:
-            self.nodes_test_requested.emit(self.nodes)
+            self.nodes_test_requested.emit(tuple(self.nodes))
     
-    def _on_node_selected(self, node: Node):
-        """节点选中事件"""
-        # 更新选中状态
-        for item in self.node_items:
-            item.set_selected(item.node.uuid == node.uuid)
-        
-        self.node_selected.emit(node)
+    def _on_current_row_changed(self, current: QModelIndex, previous: QModelIndex):
+        """当前节点变化"""
+        if current.isValid():
+            self.node_selected.emit(self._model.node_at(current.row()))
+    
+    def _on_selection_changed(self):
+        """选中节点变化"""
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        self.selected_nodes = [self._model.node_at(row) for row in rows]
     
+    @pyqtSlot(UIUpdateData)
     def _on_node_list_update(self, update_data: UIUpdateData):
         """节点列表更新回调"""
         data = update_data.data
@@ -531,51 +355,75 @@ class EnhancedNodeList(QWidget):
         else:
             self.status_label.setText("无节点")
     
+    @pyqtSlot(UIUpdateData)
     def _on_latency_progress(self, update_data: UIUpdateData):
-        """延迟测试进度回调"""
-        data = update_data.data
+        """延迟测试进度回调（只记录最新进度，由定时器合并刷新）"""
+        self._progress_pending = update_data.data
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """将最新的进度数据刷新到界面"""
+        data = self._progress_pending
+        if data is None:
+            return
+        self._progress_pending = None
+        
         completed = data.get('completed', 0)
         total = data.get('total', 0)
         percentage = data.get('percentage', 0)
         
-        # 显示进度条
-        self.progress_bar.setVisible(True)
+        # 首次进度事件时显示进度条并禁用测试按钮
+        if not self._progress_active:
+            self._progress_active = True
+            self.progress_bar.setVisible(True)
+            self.test_all_button.setEnabled(False)
+            self.test_all_button.setText("测试中...")
+            self.status_label.setText("延迟测试进行中...")
+            self.status_counter.setVisible(True)
+        
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(completed)
         
-        # 更新状态文本
-        self.status_label.setText(f"延迟测试进行中... {completed}/{total} ({percentage:.1f}%)")
-        
-        # 禁用测试按钮
-        self.test_all_button.setEnabled(False)
-        self.test_all_button.setText("测试中...")
+        # 只更新数字部分
+        self.status_counter.setText(f"{completed}/{total} {percentage:.0f}%")
     
+    @pyqtSlot(UIUpdateData)
     def _on_latency_complete(self, update_data: UIUpdateData):
         """延迟测试完成回调"""
         data = update_data.data
         
-        # 隐藏进度条
+        # 丢弃尚未刷新的进度
+        self._progress_timer.stop()
+        self._progress_pending = None
+        self._progress_active = False
+        
+        # 隐藏进度条和计数
         self.progress_bar.setVisible(False)
+        self.status_counter.setVisible(False)
         
         # 启用测试按钮
         self.test_all_button.setEnabled(True)
         self.test_all_button.setText("测试所有")
         
+        # 同步节点表中的延迟列
+        self.node_table.refresh_dynamic()
+        
+        result = data.get('result')
         if data.get('cancelled'):
             self.status_label.setText("延迟测试已取消")
+        elif result:
+            success_rate = data.get('success_rate', 0)
+            duration = data.get('test_duration', 0)
+            self.status_label.setText(f"延迟测试完成 - 成功率: {success_rate:.1f}% | 用时: {duration:.1f}s")
         else:
-            result = data.get('result')
-            if result:
-                success_rate = data.get('success_rate', 0)
-                duration = data.get('test_duration', 0)
-                self.status_label.setText(f"延迟测试完成 - 成功率: {success_rate:.1f}% | 用时: {duration:.1f}s")
-            else:
-                self.status_label.setText("延迟测试完成")
-        
-        # 更新所有节点项的延迟显示
-        for item in self.node_items:
-            item.update_latency()
+            self.status_label.setText("延迟测试完成")
+        
+        # 测试结果只带节点 uuid，而同一订阅的节点共用 uuid，无法区分具体节点，
+        # 直接重绘全部节点（取消时也可能已有部分节点更新了延迟）
+        self._model.invalidate_nodes(self.node_table.nodes)
     
+    @pyqtSlot(UIUpdateData)
     def _on_tun_status_update(self, update_data: UIUpdateData):
         """TUN模式状态更新回调"""
         data = update_data.data
@@ -584,17 +432,24 @@ class EnhancedNodeList(QWidget):
         
         if active:
             interface_text = f" ({', '.join(interfaces)})" if interfaces else ""
-            self.tun_indicator.setText(f"TUN模式: 激活{interface_text}")
-            self.tun_indicator.setStyleSheet("color: #FF9800; font-weight: bold;")
+            text = f"TUN模式: 激活{interface_text}"
+            style = "color: #FF9800; font-weight: bold;"
         else:
-            self.tun_indicator.setText("TUN模式: 未激活")
-            self.tun_indicator.setStyleSheet("color: #666666;")
+            text = "TUN模式: 未激活"
+            style = "color: #666666;"
+        
+        # 状态未变化时不重设文本和样式
+        if text == self.tun_indicator.text():
+            return
+        self.tun_indicator.setText(text)
+        self.tun_indicator.setStyleSheet(style)
     
+    @pyqtSlot(UIUpdateData)
     def _on_port_allocation_update(self, update_data: UIUpdateData):
         """端口分配更新回调"""
-        # 更新所有节点项的端口显示
-        for item in self.node_items:
-            item.update_port()
+        # 分配表以 PortAllocator 的节点ID为键，无法直接对应到行，重绘全部节点的动态列
+        self.node_table.refresh_dynamic()
+        self._model.invalidate_nodes(self.node_table.nodes)
     
     def start_latency_test(self):
         """启动延迟测试"""
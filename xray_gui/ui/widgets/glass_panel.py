@@ -8,6 +8,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QColor, QFont
 
+from ..styles import install_stylesheet
+
 
 class GlassPanel(QFrame):
     """玻璃态面板组件"""
@@ -18,7 +20,7 @@ class GlassPanel(QFrame):
         
         self._title = title
         self._setup_ui()
-        self._apply_styles()
+        install_stylesheet("glass")
         self._add_shadow()
     
     def _setup_ui(self):
@@ -42,22 +44,6 @@ class GlassPanel(QFrame):
         self.content_layout.setSpacing(10)
         self.main_layout.addWidget(self.content_widget)
     
-    def _apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet("""
-            #glass_panel {
-                background-color: rgba(30, 30, 50, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 16px;
-            }
-            
-            #panel_title {
-                color: rgba(255, 255, 255, 0.95);
-                padding-bottom: 5px;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
-    
     def _add_shadow(self):
         """添加阴影效果"""
         shadow = QGraphicsDropShadowEffect(self)
@@ -87,7 +73,7 @@ class GlassCard(QFrame):
         self.setObjectName("glass_card")
         
         self._setup_ui()
-        self._apply_styles()
+        install_stylesheet("glass")
     
     def _setup_ui(self):
         """设置 UI"""
@@ -95,21 +81,6 @@ class GlassCard(QFrame):
         self.layout.setContentsMargins(15, 12, 15, 12)
         self.layout.setSpacing(8)
     
-    def _apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet("""
-            #glass_card {
-                background-color: rgba(40, 40, 60, 0.5);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-            }
-            
-            #glass_card:hover {
-                background-color: rgba(50, 50, 70, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
-    
     def add_widget(self, widget: QWidget):
         """添加子组件"""
         self.layout.addWidget(widget)
@@ -126,7 +97,7 @@ class GlassButton(QFrame):
         self._text = text
         self._icon = icon
         self._setup_ui()
-        self._apply_styles()
+        install_stylesheet("glass")
     
     def _setup_ui(self):
         """设置 UI"""
@@ -146,29 +117,3 @@ class GlassButton(QFrame):
         
         layout.addStretch()
     
-    def _apply_styles(self):
-        """应用样式"""
-        self.setStyleSheet("""
-            #glass_button {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(120, 0, 255, 0.4),
-                    stop:1 rgba(0, 212, 255, 0.4)
-                );
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 10px;
-            }
-            
-            #glass_button:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(140, 20, 255, 0.6),
-                    stop:1 rgba(20, 232, 255, 0.6)
-                );
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            #button_icon, #button_text {
-                color: rgba(255, 255, 255, 0.95);
-            }
-        """)
@@ -1,28 +1,269 @@
 """
 主页面组件 - 合并订阅、节点列表和控制面板（增强版）
 Feature: xray-protocol-enhancement, Requirements 1.1-1.8, 2.1-2.5, 4.1-4.6, 5.1-5.5
+
+注意：不要给控制栏中的控件添加 QGraphicsDropShadowEffect，图形效果会让整个控件
+走离屏软件渲染，频繁点击/刷新时开销明显；需要阴影请使用静态图片或重写 paintEvent。
 """
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QPushButton, QWidget, QTableWidget,
-    QTableWidgetItem, QHeaderView, QMenu, QAbstractItemView,
-    QGraphicsDropShadowEffect, QProgressBar, QSplitter,
+    QLineEdit, QPushButton, QWidget,
     QCheckBox, QComboBox, QSpinBox, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer
-from PyQt6.QtGui import QColor, QFont, QAction
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 
-from typing import List, Optional, TYPE_CHECKING
+import functools
+from typing import ClassVar, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from xray_gui.core.node import Node
 
 from .enhanced_node_list import EnhancedNodeList
+from .busy_bar import BusyBar
 from ...core.ui_integration_manager import UIIntegrationManager, UIUpdateType, UIUpdateData
 from ...core.concurrent_latency_tester import ConcurrentTestConfig, TestStrategy
 from ...core.system_adaptability_manager import SystemAdaptabilityManager
 
 
+@functools.lru_cache(maxsize=64)
+def _make_latency_config(max_concurrent: int, timeout: float,
+                         strategy: TestStrategy, bypass_tun: bool) -> ConcurrentTestConfig:
+    """
+    构建延迟测试配置，相同参数复用同一对象
+
+    返回的配置对象被多处共享，不应原地修改
+    """
+    return ConcurrentTestConfig(
+        max_concurrent=max_concurrent,
+        timeout=timeout,
+        strategy=strategy,
+        bypass_tun=bypass_tun
+    )
+
+
+# 主页面样式表（模块级常量，只构建一次）
+_MAIN_PAGE_QSS = """
+    #main_page {
+        background: transparent;
+    }
+    
+    #control_bar {
+        background: rgba(20, 15, 40, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 14px;
+    }
+    
+    #field_label {
+        color: rgba(180, 150, 220, 0.9);
+        font-size: 11px;
+    }
+    
+    #url_input {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: white;
+        font-size: 12px;
+    }
+    
+    #url_input:focus {
+        border: 1px solid rgba(120, 0, 255, 0.6);
+    }
+    
+    #action_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(100, 0, 200, 0.7),
+            stop:1 rgba(0, 150, 200, 0.7)
+        );
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    
+    #action_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(120, 20, 220, 0.9),
+            stop:1 rgba(20, 170, 220, 0.9)
+        );
+    }
+    
+    #action_btn:disabled {
+        background: rgba(60, 50, 80, 0.5);
+    }
+    
+    #cancel_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(200, 80, 80, 0.7),
+            stop:1 rgba(180, 50, 100, 0.7)
+        );
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    
+    #cancel_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(220, 100, 100, 0.9),
+            stop:1 rgba(200, 70, 120, 0.9)
+        );
+    }
+    
+    #separator {
+        background: rgba(120, 0, 255, 0.3);
+    }
+    
+    #start_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(0, 180, 100, 0.8),
+            stop:1 rgba(0, 130, 180, 0.8)
+        );
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    
+    #start_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(20, 200, 120, 0.9),
+            stop:1 rgba(20, 150, 200, 0.9)
+        );
+    }
+    
+    #start_btn:disabled {
+        background: rgba(60, 50, 80, 0.5);
+    }
+    
+    #stop_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(200, 80, 80, 0.8),
+            stop:1 rgba(180, 50, 100, 0.8)
+        );
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    
+    #stop_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(220, 100, 100, 0.9),
+            stop:1 rgba(200, 70, 120, 0.9)
+        );
+    }
+    
+    #stop_btn:disabled {
+        background: rgba(60, 50, 80, 0.5);
+    }
+    
+    #config_group {
+        background: rgba(20, 15, 40, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 12px;
+        color: rgba(180, 150, 220, 0.9);
+        font-size: 12px;
+        font-weight: bold;
+    }
+    
+    #config_group::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+    }
+    
+    #config_label {
+        color: rgba(180, 150, 220, 0.9);
+        font-size: 10px;
+    }
+    
+    #config_spin {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 6px;
+        padding: 4px 8px;
+        color: white;
+        font-size: 11px;
+    }
+    
+    #config_spin:focus {
+        border: 1px solid rgba(120, 0, 255, 0.6);
+    }
+    
+    #config_combo {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 6px;
+        padding: 4px 8px;
+        color: white;
+        font-size: 11px;
+    }
+    
+    #config_combo:focus {
+        border: 1px solid rgba(120, 0, 255, 0.6);
+    }
+    
+    #config_combo::drop-down {
+        border: none;
+    }
+    
+    #config_combo::down-arrow {
+        image: none;
+        border: none;
+    }
+    
+    #config_check {
+        color: rgba(180, 150, 220, 0.9);
+        font-size: 10px;
+    }
+    
+    #config_check::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    
+    #config_check::indicator:unchecked {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 3px;
+    }
+    
+    #config_check::indicator:checked {
+        background: rgba(120, 0, 255, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.6);
+        border-radius: 3px;
+    }
+    
+    #system_status {
+        color: #4CAF50;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    
+    #system_status[status="warn"] {
+        color: #FF9800;
+    }
+    
+    #system_status[status="err"] {
+        color: #F44336;
+    }
+"""
+
+
 class MainPage(QFrame):
     """主页面 - 合并所有功能（增强版）"""
     
@@ -30,14 +271,36 @@ class MainPage(QFrame):
     refresh_requested = pyqtSignal(str)
     start_requested = pyqtSignal()
     stop_requested = pyqtSignal()
-    test_selected = pyqtSignal(list)
+    test_selected = pyqtSignal(tuple)  # 以元组传递，避免转换为 QVariantList
     test_all = pyqtSignal()
+    error_notified = pyqtSignal(str)  # 错误通知消息
+    
+    # 内部信号：将管理器回调（可能来自工作线程）转发到UI线程
+    _latency_test_progress = pyqtSignal(UIUpdateData)
+    _latency_test_complete = pyqtSignal(UIUpdateData)
+    _tun_mode_status = pyqtSignal(UIUpdateData)
+    _system_adaptation = pyqtSignal(UIUpdateData)
+    _error_notification = pyqtSignal(UIUpdateData)
+    
+    # 测试进度刷新间隔（毫秒），约 30Hz
+    PROGRESS_FLUSH_INTERVAL = 33
+    
+    # 配置控件防抖间隔（毫秒）
+    CONFIG_DEBOUNCE_MS = 150
+    
+    # 测试策略选项（下拉框文本, 策略），策略作为选项的 userData 保存
+    _STRATEGY_OPTIONS: ClassVar[Tuple[Tuple[str, TestStrategy], ...]] = (
+        ("异步并发", TestStrategy.ASYNCIO),
+        ("线程池", TestStrategy.THREADING),
+        ("进程池", TestStrategy.PROCESS_POOL),
+    )
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("main_page")
         
         self._nodes: List = []
+        self._nodes_key: tuple = ()  # 当前节点的对象标识，用于跳过重复设置
         self._is_running = False
         
         # 初始化UI集成管理器
@@ -45,12 +308,20 @@ class MainPage(QFrame):
         self.adaptability_manager = SystemAdaptabilityManager()
         
         # 延迟测试配置
-        self._latency_config = ConcurrentTestConfig(
-            max_concurrent=10,
-            timeout=5.0,
-            strategy=TestStrategy.ASYNCIO,
-            bypass_tun=True
-        )
+        self._latency_config = _make_latency_config(10, 5.0, TestStrategy.ASYNCIO, True)
+        
+        # 测试进度合并刷新：回调只记录最新进度，由定时器在测试期间定期刷新到界面
+        self._pending_progress: Optional[dict] = None
+        self._progress_text = ""  # 上次写入测试按钮的进度文本
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setInterval(self.PROGRESS_FLUSH_INTERVAL)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+        
+        # 配置防抖：连续调整控件只在停顿后构建一次配置
+        self._config_debounce = QTimer(self)
+        self._config_debounce.setSingleShot(True)
+        self._config_debounce.setInterval(self.CONFIG_DEBOUNCE_MS)
+        self._config_debounce.timeout.connect(self._apply_latency_config)
         
         self._setup_ui()
         self._apply_styles()
@@ -147,26 +418,54 @@ class MainPage(QFrame):
         layout.addWidget(control_bar)
         
         # 进度条
-        self.progress = QProgressBar()
+        self.progress = BusyBar()
         self.progress.setObjectName("progress_bar")
         self.progress.setFixedHeight(3)
-        self.progress.setTextVisible(False)
         self.progress.setRange(0, 0)
         self.progress.setVisible(False)
         layout.addWidget(self.progress)
     
     def _create_latency_config_panel(self, layout):
-        """创建延迟测试配置面板"""
-        config_group = QGroupBox("延迟测试配置")
-        config_group.setObjectName("config_group")
-        config_group.setCheckable(True)
-        config_group.setChecked(False)  # 默认折叠
-        config_group.setFixedHeight(120)
-        
-        config_layout = QHBoxLayout(config_group)
+        """创建延迟测试配置面板（配置控件在首次展开时才创建）"""
+        self._config_group = QGroupBox("延迟测试配置")
+        self._config_group.setObjectName("config_group")
+        self._config_group.setCheckable(True)
+        self._config_group.setChecked(False)  # 默认折叠
+        self._config_group.setFixedHeight(120)
+        self._config_group.toggled.connect(self._build_config_widgets_once)
+        self._config_widgets_built = False
+        
+        config_layout = QHBoxLayout(self._config_group)
         config_layout.setContentsMargins(15, 25, 15, 10)
         config_layout.setSpacing(20)
         
+        config_layout.addStretch()
+        
+        # 系统状态指示器
+        status_widget = QWidget()
+        status_layout = QVBoxLayout(status_widget)
+        status_layout.setContentsMargins(0, 0, 0, 0)
+        status_layout.setSpacing(4)
+        
+        status_label = QLabel("系统状态")
+        status_label.setObjectName("config_label")
+        status_layout.addWidget(status_label)
+        
+        self.system_status_label = QLabel("正常")
+        self.system_status_label.setObjectName("system_status")
+        status_layout.addWidget(self.system_status_label)
+        
+        config_layout.addWidget(status_widget)
+        
+        layout.addWidget(self._config_group)
+    
+    def _build_config_widgets_once(self, checked: bool):
+        """首次展开时创建配置控件，初始值取自当前测试配置"""
+        if not checked or self._config_widgets_built:
+            return
+        self._config_widgets_built = True
+        config_layout = self._config_group.layout()
+        
         # 并发数设置
         concurrent_widget = QWidget()
         concurrent_layout = QVBoxLayout(concurrent_widget)
@@ -180,11 +479,10 @@ class MainPage(QFrame):
         self.concurrent_spin = QSpinBox()
         self.concurrent_spin.setObjectName("config_spin")
         self.concurrent_spin.setRange(1, 50)
-        self.concurrent_spin.setValue(10)
         self.concurrent_spin.valueChanged.connect(self._update_latency_config)
         concurrent_layout.addWidget(self.concurrent_spin)
         
-        config_layout.addWidget(concurrent_widget)
+        config_layout.insertWidget(0, concurrent_widget)
         
         # 超时设置
         timeout_widget = QWidget()
@@ -199,11 +497,10 @@ class MainPage(QFrame):
         self.timeout_spin = QSpinBox()
         self.timeout_spin.setObjectName("config_spin")
         self.timeout_spin.setRange(1, 30)
-        self.timeout_spin.setValue(5)
         self.timeout_spin.valueChanged.connect(self._update_latency_config)
         timeout_layout.addWidget(self.timeout_spin)
         
-        config_layout.addWidget(timeout_widget)
+        config_layout.insertWidget(1, timeout_widget)
         
         # 测试策略
         strategy_widget = QWidget()
@@ -217,11 +514,12 @@ class MainPage(QFrame):
         
         self.strategy_combo = QComboBox()
         self.strategy_combo.setObjectName("config_combo")
-        self.strategy_combo.addItems(["异步并发", "线程池", "混合模式"])
-        self.strategy_combo.currentTextChanged.connect(self._update_latency_config)
+        for text, strategy in self._STRATEGY_OPTIONS:
+            self.strategy_combo.addItem(text, strategy)
+        self.strategy_combo.currentIndexChanged.connect(self._update_latency_config)
         strategy_layout.addWidget(self.strategy_combo)
         
-        config_layout.addWidget(strategy_widget)
+        config_layout.insertWidget(2, strategy_widget)
         
         # TUN模式绕过
         bypass_widget = QWidget()
@@ -235,31 +533,12 @@ class MainPage(QFrame):
         
         self.bypass_check = QCheckBox("启用直连测试")
         self.bypass_check.setObjectName("config_check")
-        self.bypass_check.setChecked(True)
         self.bypass_check.toggled.connect(self._update_latency_config)
         bypass_layout.addWidget(self.bypass_check)
         
-        config_layout.addWidget(bypass_widget)
-        
-        config_layout.addStretch()
-        
-        # 系统状态指示器
-        status_widget = QWidget()
-        status_layout = QVBoxLayout(status_widget)
-        status_layout.setContentsMargins(0, 0, 0, 0)
-        status_layout.setSpacing(4)
-        
-        status_label = QLabel("系统状态")
-        status_label.setObjectName("config_label")
-        status_layout.addWidget(status_label)
-        
-        self.system_status_label = QLabel("正常")
-        self.system_status_label.setObjectName("system_status")
-        status_layout.addWidget(self.system_status_label)
-        
-        config_layout.addWidget(status_widget)
+        config_layout.insertWidget(3, bypass_widget)
         
-        layout.addWidget(config_group)
+        self._apply_config_to_ui(self._latency_config)
     
     def _create_enhanced_node_list(self, layout):
         """创建增强的节点列表"""
@@ -274,330 +553,59 @@ class MainPage(QFrame):
     
     def _setup_ui_callbacks(self):
         """设置UI回调"""
-        # 注册UI更新回调
-        self.ui_manager.register_ui_callback(UIUpdateType.LATENCY_TEST_PROGRESS, self._on_latency_progress)
-        self.ui_manager.register_ui_callback(UIUpdateType.LATENCY_TEST_COMPLETE, self._on_latency_complete)
-        self.ui_manager.register_ui_callback(UIUpdateType.TUN_MODE_STATUS, self._on_tun_status_update)
-        self.ui_manager.register_ui_callback(UIUpdateType.SYSTEM_ADAPTATION, self._on_system_adaptation)
-        self.ui_manager.register_ui_callback(UIUpdateType.ERROR_NOTIFICATION, self._on_error_notification)
+        # 注册UI更新回调：管理器回调只负责发射信号，处理函数以队列连接在UI线程执行
+        signal_slots = [
+            (UIUpdateType.LATENCY_TEST_PROGRESS, self._latency_test_progress, self._on_latency_progress),
+            (UIUpdateType.LATENCY_TEST_COMPLETE, self._latency_test_complete, self._on_latency_complete),
+            (UIUpdateType.TUN_MODE_STATUS, self._tun_mode_status, self._on_tun_status_update),
+            (UIUpdateType.SYSTEM_ADAPTATION, self._system_adaptation, self._on_system_adaptation),
+            (UIUpdateType.ERROR_NOTIFICATION, self._error_notification, self._on_error_notification),
+        ]
+        for update_type, signal, slot in signal_slots:
+            signal.connect(slot, Qt.ConnectionType.QueuedConnection)
+            self.ui_manager.register_ui_callback(update_type, signal.emit)
+    
+    def _apply_config_to_ui(self, config: ConcurrentTestConfig):
+        """将配置同步到控件（屏蔽控件信号，不触发配置更新）"""
+        if not self._config_widgets_built:
+            return  # 控件创建时会读取当前配置
+        widgets = (self.concurrent_spin, self.timeout_spin, self.strategy_combo, self.bypass_check)
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            self.concurrent_spin.setValue(config.max_concurrent)
+            self.timeout_spin.setValue(int(config.timeout))
+            index = self.strategy_combo.findData(config.strategy)
+            if index >= 0:
+                self.strategy_combo.setCurrentIndex(index)
+            self.bypass_check.setChecked(config.bypass_tun)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+    
+    def set_latency_config(self, config: ConcurrentTestConfig):
+        """设置延迟测试配置并同步到控件"""
+        self._config_debounce.stop()
+        self._latency_config = config
+        self._apply_config_to_ui(config)
     
     def _update_latency_config(self):
-        """更新延迟测试配置"""
-        strategy_map = {
-            "异步并发": TestStrategy.ASYNCIO,
-            "线程池": TestStrategy.THREADING,
-            "混合模式": TestStrategy.HYBRID
-        }
-        
-        self._latency_config = ConcurrentTestConfig(
-            max_concurrent=self.concurrent_spin.value(),
-            timeout=float(self.timeout_spin.value()),
-            strategy=strategy_map.get(self.strategy_combo.currentText(), TestStrategy.ASYNCIO),
-            bypass_tun=self.bypass_check.isChecked()
-        )
+        """配置控件变化（重新开始防抖计时）"""
+        self._config_debounce.start()
     
-    def _create_control_bar(self, layout):
-        """创建控制栏"""
-        control_bar = QFrame()
-        control_bar.setObjectName("control_bar")
-        control_bar.setFixedHeight(70)
-        
-        bar_layout = QHBoxLayout(control_bar)
-        bar_layout.setContentsMargins(20, 12, 20, 12)
-        bar_layout.setSpacing(15)
-        
-        # 订阅 URL 输入
-        url_widget = QWidget()
-        url_layout = QVBoxLayout(url_widget)
-        url_layout.setContentsMargins(0, 0, 0, 0)
-        url_layout.setSpacing(4)
-        
-        url_label = QLabel("订阅地址")
-        url_label.setObjectName("field_label")
-        url_layout.addWidget(url_label)
-        
-        self.url_input = QLineEdit()
-        self.url_input.setObjectName("url_input")
-        self.url_input.setPlaceholderText("请输入订阅地址...")
-        url_layout.addWidget(self.url_input)
-        
-        bar_layout.addWidget(url_widget, 1)
-        
-        # 刷新按钮
-        self.refresh_btn = QPushButton("↻ 刷新")
-        self.refresh_btn.setObjectName("action_btn")
-        self.refresh_btn.setFixedSize(90, 38)
-        self.refresh_btn.clicked.connect(self._on_refresh)
-        bar_layout.addWidget(self.refresh_btn)
-        
-        # 测速按钮
-        self.test_btn = QPushButton("⚡ 测速")
-        self.test_btn.setObjectName("action_btn")
-        self.test_btn.setFixedSize(90, 38)
-        self.test_btn.clicked.connect(self._on_test)
-        bar_layout.addWidget(self.test_btn)
-        
-        # 分隔线
-        sep = QFrame()
-        sep.setObjectName("separator")
-        sep.setFixedWidth(1)
-        sep.setFixedHeight(40)
-        bar_layout.addWidget(sep)
-        
-        # 启动/停止按钮
-        self.start_btn = QPushButton("▶ 启动")
-        self.start_btn.setObjectName("start_btn")
-        self.start_btn.setFixedSize(100, 38)
-        self.start_btn.clicked.connect(self._on_start)
-        bar_layout.addWidget(self.start_btn)
-        
-        self.stop_btn = QPushButton("■ 停止")
-        self.stop_btn.setObjectName("stop_btn")
-        self.stop_btn.setFixedSize(100, 38)
-        self.stop_btn.setEnabled(False)
-        self.stop_btn.clicked.connect(self._on_stop)
-        bar_layout.addWidget(self.stop_btn)
-        
-        layout.addWidget(control_bar)
-        
-        # 进度条
-        self.progress = QProgressBar()
-        self.progress.setObjectName("progress_bar")
-        self.progress.setFixedHeight(3)
-        self.progress.setTextVisible(False)
-        self.progress.setRange(0, 0)
-        self.progress.setVisible(False)
-        layout.addWidget(self.progress)
-
+    def _apply_latency_config(self):
+        """更新延迟测试配置（配置未变化时保留原对象）"""
+        config = _make_latency_config(
+            self.concurrent_spin.value(),
+            float(self.timeout_spin.value()),
+            self.strategy_combo.currentData() or TestStrategy.ASYNCIO,
+            self.bypass_check.isChecked()
+        )
+        if config != self._latency_config:
+            self._latency_config = config
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #main_page {
-                background: transparent;
-            }
-            
-            #control_bar {
-                background: rgba(20, 15, 40, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 14px;
-            }
-            
-            #field_label {
-                color: rgba(180, 150, 220, 0.9);
-                font-size: 11px;
-            }
-            
-            #url_input {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: white;
-                font-size: 12px;
-            }
-            
-            #url_input:focus {
-                border: 1px solid rgba(120, 0, 255, 0.6);
-            }
-            
-            #action_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(100, 0, 200, 0.7),
-                    stop:1 rgba(0, 150, 200, 0.7)
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            
-            #action_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(120, 20, 220, 0.9),
-                    stop:1 rgba(20, 170, 220, 0.9)
-                );
-            }
-            
-            #action_btn:disabled {
-                background: rgba(60, 50, 80, 0.5);
-            }
-            
-            #cancel_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(200, 80, 80, 0.7),
-                    stop:1 rgba(180, 50, 100, 0.7)
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            
-            #cancel_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(220, 100, 100, 0.9),
-                    stop:1 rgba(200, 70, 120, 0.9)
-                );
-            }
-            
-            #separator {
-                background: rgba(120, 0, 255, 0.3);
-            }
-            
-            #start_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(0, 180, 100, 0.8),
-                    stop:1 rgba(0, 130, 180, 0.8)
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            
-            #start_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(20, 200, 120, 0.9),
-                    stop:1 rgba(20, 150, 200, 0.9)
-                );
-            }
-            
-            #start_btn:disabled {
-                background: rgba(60, 50, 80, 0.5);
-            }
-            
-            #stop_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(200, 80, 80, 0.8),
-                    stop:1 rgba(180, 50, 100, 0.8)
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            
-            #stop_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(220, 100, 100, 0.9),
-                    stop:1 rgba(200, 70, 120, 0.9)
-                );
-            }
-            
-            #stop_btn:disabled {
-                background: rgba(60, 50, 80, 0.5);
-            }
-            
-            #progress_bar {
-                background: rgba(40, 30, 60, 0.5);
-                border: none;
-                border-radius: 1px;
-            }
-            
-            #progress_bar::chunk {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7800ff,
-                    stop:1 #00d4ff
-                );
-            }
-            
-            #config_group {
-                background: rgba(20, 15, 40, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 12px;
-                color: rgba(180, 150, 220, 0.9);
-                font-size: 12px;
-                font-weight: bold;
-            }
-            
-            #config_group::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-            }
-            
-            #config_label {
-                color: rgba(180, 150, 220, 0.9);
-                font-size: 10px;
-            }
-            
-            #config_spin {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 6px;
-                padding: 4px 8px;
-                color: white;
-                font-size: 11px;
-            }
-            
-            #config_spin:focus {
-                border: 1px solid rgba(120, 0, 255, 0.6);
-            }
-            
-            #config_combo {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 6px;
-                padding: 4px 8px;
-                color: white;
-                font-size: 11px;
-            }
-            
-            #config_combo:focus {
-                border: 1px solid rgba(120, 0, 255, 0.6);
-            }
-            
-            #config_combo::drop-down {
-                border: none;
-            }
-            
-            #config_combo::down-arrow {
-                image: none;
-                border: none;
-            }
-            
-            #config_check {
-                color: rgba(180, 150, 220, 0.9);
-                font-size: 10px;
-            }
-            
-            #config_check::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            
-            #config_check::indicator:unchecked {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 3px;
-            }
-            
-            #config_check::indicator:checked {
-                background: rgba(120, 0, 255, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.6);
-                border-radius: 3px;
-            }
-            
-            #system_status {
-                color: #4CAF50;
-                font-size: 10px;
-                font-weight: bold;
-            }
-        """)
+        self.setStyleSheet(_MAIN_PAGE_QSS)
     
     def _on_refresh(self):
         """刷新按钮点击"""
@@ -611,12 +619,7 @@ class MainPage(QFrame):
             return
         
         # 使用增强的延迟测试
-        success = self.ui_manager.start_latency_test(
-            nodes=self._nodes,
-            config=self._latency_config
-        )
-        
-        if success:
+        if self._start_latency_test(self._nodes):
             self.test_btn.setVisible(False)
             self.cancel_test_btn.setVisible(True)
     
@@ -642,33 +645,62 @@ class MainPage(QFrame):
     def _on_nodes_test_requested(self, nodes):
         """批量节点测试请求"""
         if not self.ui_manager.is_latency_test_running():
-            self.ui_manager.start_latency_test(nodes=nodes, config=self._latency_config)
+            self._start_latency_test(nodes)
     
     def _on_single_node_test_requested(self, node):
         """单个节点测试请求"""
         if not self.ui_manager.is_latency_test_running():
-            self.ui_manager.start_latency_test(nodes=[node], config=self._latency_config)
+            self._start_latency_test([node])
+    
+    def _start_latency_test(self, nodes: Sequence['Node']) -> bool:
+        """以当前配置启动延迟测试，成功时开始刷新进度"""
+        # 防抖中的配置修改立即生效
+        if self._config_debounce.isActive():
+            self._config_debounce.stop()
+            self._apply_latency_config()
+        
+        if not self.ui_manager.start_latency_test(nodes=nodes, config=self._latency_config):
+            return False
+        self.progress.setRange(0, 100)
+        self.progress.setValue(0)
+        self._progress_flush_timer.start()
+        return True
     
     def _on_latency_progress(self, update_data: UIUpdateData):
-        """延迟测试进度回调"""
-        data = update_data.data
-        completed = data.get('completed', 0)
-        total = data.get('total', 0)
-        percentage = data.get('percentage', 0)
+        """延迟测试进度回调（只记录最新进度）"""
+        self._pending_progress = update_data.data
+    
+    def _flush_progress(self):
+        """将最新的进度刷新到界面"""
+        data = self._pending_progress
+        if data is None:
+            return
+        self._pending_progress = None
         
-        # 显示进度条
-        self.progress.setVisible(True)
-        self.progress.setMaximum(total)
-        self.progress.setValue(completed)
+        percentage = data.get('percentage', 0)
         
-        # 更新按钮状态
-        self.test_btn.setEnabled(False)
-        self.test_btn.setText(f"测试中... {percentage:.1f}%")
+        # 显示进度条（测试开始时已切换为 0-100 的确定进度），只在状态变化时调用控件接口
+        if self.progress.isHidden():
+            self.progress.setVisible(True)
+        self.progress.setValue(int(percentage))
+        
+        # 更新按钮状态（文本相同则跳过）
+        if self.test_btn.isEnabled():
+            self.test_btn.setEnabled(False)
+        text = f"测试中... {percentage:.1f}%"
+        if text != self._progress_text:
+            self._progress_text = text
+            self.test_btn.setText(text)
     
     def _on_latency_complete(self, update_data: UIUpdateData):
         """延迟测试完成回调"""
         data = update_data.data
         
+        # 丢弃尚未刷新的进度
+        self._progress_flush_timer.stop()
+        self._pending_progress = None
+        self._progress_text = ""
+        
         # 隐藏进度条
         self.progress.setVisible(False)
         
@@ -681,6 +713,7 @@ class MainPage(QFrame):
         # 更新节点列表
         if 'updated_nodes' in data:
             self._nodes = data['updated_nodes']
+            self._nodes_key = tuple(map(id, self._nodes))
             self.enhanced_node_list.update_nodes(self._nodes)
     
     def _on_tun_status_update(self, update_data: UIUpdateData):
@@ -689,11 +722,9 @@ class MainPage(QFrame):
         active = data.get('active', False)
         
         if active:
-            self.system_status_label.setText("TUN模式激活")
-            self.system_status_label.setStyleSheet("color: #FF9800; font-weight: bold;")
+            self._set_system_status("TUN模式激活", "warn")
         else:
-            self.system_status_label.setText("正常")
-            self.system_status_label.setStyleSheet("color: #4CAF50;")
+            self._set_system_status("正常", "ok")
     
     def _on_system_adaptation(self, update_data: UIUpdateData):
         """系统适应性回调"""
@@ -701,20 +732,38 @@ class MainPage(QFrame):
         is_healthy = data.get('is_healthy', True)
         
         if is_healthy:
-            self.system_status_label.setText("正常")
-            self.system_status_label.setStyleSheet("color: #4CAF50;")
+            self._set_system_status("正常", "ok")
         else:
-            self.system_status_label.setText("异常")
-            self.system_status_label.setStyleSheet("color: #F44336; font-weight: bold;")
+            self._set_system_status("异常", "err")
+    
+    def _set_system_status(self, text: str, status: str):
+        """设置系统状态文本，颜色由样式表按 status 属性选择（ok / warn / err）"""
+        label = self.system_status_label
+        label.setText(text)
+        if label.property("status") == status:
+            return
+        label.setProperty("status", status)
+        # 属性变化后重新应用样式
+        label.style().unpolish(label)
+        label.style().polish(label)
     
     def _on_error_notification(self, update_data: UIUpdateData):
         """错误通知回调"""
         data = update_data.data
         message = data.get('message', '')
         
-        # 可以在这里显示错误通知
-        # 例如使用状态栏或弹出通知
-        print(f"Error: {message}")  # 临时处理
+        # 交给上层决定如何展示或记录（状态栏、弹出通知、日志等）
+        self.error_notified.emit(message)
+    
+    def showEvent(self, event):
+        """页面可见时恢复系统监控"""
+        super().showEvent(event)
+        self.adaptability_manager.resume_monitoring()
+    
+    def hideEvent(self, event):
+        """页面隐藏时暂停系统监控，无人查看时不做检测"""
+        super().hideEvent(event)
+        self.adaptability_manager.pause_monitoring()
     
     def set_url(self, url: str):
         """设置订阅 URL"""
@@ -726,6 +775,8 @@ class MainPage(QFrame):
     
     def set_loading(self, loading: bool):
         """设置加载状态"""
+        if loading:
+            self.progress.setRange(0, 0)  # 测速后可能仍是确定进度，恢复为忙碌状态
         self.progress.setVisible(loading)
         self.refresh_btn.setEnabled(not loading)
     
@@ -735,8 +786,13 @@ class MainPage(QFrame):
         self.start_btn.setEnabled(not running)
         self.stop_btn.setEnabled(running)
     
-    def set_nodes(self, nodes: List):
-        """设置节点列表"""
+    def set_nodes(self, nodes: List['Node']):
+        """设置节点列表（节点未变化时跳过）"""
+        # 以节点对象身份比对，同一列表原地修改后也能识别
+        nodes_key = tuple(map(id, nodes))
+        if nodes_key == self._nodes_key:
+            return
+        self._nodes_key = nodes_key
         self._nodes = nodes
         
         # 更新增强节点列表
@@ -745,7 +801,7 @@ class MainPage(QFrame):
         # 通知UI管理器
         self.ui_manager.update_node_list(nodes)
     
-    def get_selected_nodes(self) -> List:
+    def get_selected_nodes(self) -> List['Node']:
         """获取选中的节点（兼容性方法）"""
         # 这个方法保留用于向后兼容
         return []
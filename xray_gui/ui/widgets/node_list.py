@@ -3,17 +3,319 @@
 """
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QMenu, QAbstractItemView, QPushButton, QWidget,
-    QGraphicsDropShadowEffect, QLineEdit
+    QTableView, QHeaderView,
+    QMenu, QAbstractItemView, QPushButton, QWidget, QLineEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor, QFont, QAction
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import difflib
 
-if TYPE_CHECKING:
-    from xray_gui.core.node import Node
+from ...core.node import Node
+from ...core.node_table import NodeTable
+from ...core.filter_engine import FilterEngine
+
+
+# 延迟颜色，按 latency_level 的等级索引：未测试、超时、<100ms、<300ms、其他
+_LATENCY_COLORS = (
+    QColor(150, 150, 150),
+    QColor(255, 100, 100),
+    QColor(100, 255, 150),
+    QColor(255, 220, 100),
+    QColor(255, 150, 100),
+)
+
+# 节点列表外框样式表（模块级常量，只构建一次）
+# 工具栏和表格的样式分别设置在各自控件上，减少每个子控件需要匹配的选择器
+_NODE_LIST_QSS = """
+    #node_list_widget {
+        background-color: rgba(30, 30, 50, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+    }
+"""
+
+# 工具栏样式表（搜索框、统计、测速按钮）
+_TOOLBAR_QSS = """
+    #toolbar {
+        background: rgba(20, 20, 40, 0.5);
+        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        border-top-left-radius: 16px;
+        border-top-right-radius: 16px;
+    }
+
+    #search_input {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 8px;
+        padding: 6px 12px;
+        color: white;
+    }
+
+    #search_input:focus {
+        border: 1px solid rgba(120, 0, 255, 0.5);
+    }
+
+    #count_label {
+        color: rgba(255, 255, 255, 0.7);
+        padding: 0 15px;
+    }
+
+    #action_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(120, 0, 255, 0.6),
+            stop:1 rgba(0, 212, 255, 0.6)
+        );
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        color: white;
+        font-weight: bold;
+    }
+
+    #action_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(140, 20, 255, 0.8),
+            stop:1 rgba(20, 232, 255, 0.8)
+        );
+    }
+"""
+
+# 表格样式表（含表头）
+_NODE_TABLE_QSS = """
+    #node_table {
+        background: transparent;
+        border: none;
+        gridline-color: transparent;
+    }
+
+    #node_table::item {
+        padding: 8px;
+        color: rgba(255, 255, 255, 0.9);
+    }
+
+    #node_table::item:selected {
+        background: rgba(120, 0, 255, 0.3);
+    }
+
+    #node_table::item:alternate {
+        background: rgba(255, 255, 255, 0.03);
+    }
+
+    QHeaderView::section {
+        background: rgba(40, 40, 60, 0.8);
+        color: rgba(255, 255, 255, 0.8);
+        padding: 10px;
+        border: none;
+        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        font-weight: bold;
+    }
+"""
+
+# 右键菜单样式表
+_MENU_QSS = """
+    QMenu {
+        background: rgba(30, 30, 50, 0.95);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 8px;
+        padding: 5px;
+    }
+    QMenu::item {
+        padding: 8px 20px;
+        color: rgba(255, 255, 255, 0.9);
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background: rgba(120, 0, 255, 0.4);
+    }
+"""
+
+
+class NodeTableModel(QAbstractTableModel):
+    """节点表格模型 - 直接按行号索引 NodeTable 的列，只在视图请求时生成单元格数据"""
+    
+    COLUMNS = ["", "节点名称", "地址", "端口", "本地端口", "延迟", "协议"]
+    
+    # 各列对齐方式（预先转换为 int，data() 直接查表返回）
+    _ALIGN_CENTER = int(Qt.AlignmentFlag.AlignCenter.value)
+    _ALIGN_DEFAULT = int((Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft).value)
+    _COL_ALIGN = {0: _ALIGN_CENTER, 3: _ALIGN_CENTER, 4: _ALIGN_CENTER, 5: _ALIGN_CENTER, 6: _ALIGN_CENTER}
+    
+    def __init__(self, parent=None, latency_colors: Tuple[QColor, ...] = _LATENCY_COLORS):
+        super().__init__(parent)
+        self._latency_colors = latency_colors  # 按延迟等级索引的颜色，浅色主题可替换
+        self._t = NodeTable()
+        self._filtered_indices: List[int] = []
+        self._rows: List[int] = []  # 当前显示的各行在节点表中的索引
+        self._row_keys: List[int] = []  # 各行节点的标识，用于比对增删
+        self._render_cache: Dict[int, Tuple[str, ...]] = {}  # 节点标识 -> 各列显示文本
+    
+    def set_nodes(self, table: NodeTable, filtered_indices: List[int]):
+        """设置节点表及过滤后的行索引"""
+        if table is not self._t:
+            self._t = table
+            self._render_cache.clear()
+        self._update_rows(filtered_indices)
+    
+    def invalidate_node(self, node: Node):
+        """节点字段变化后丢弃其缓存的显示文本，只通知视图重绘该行的动态列"""
+        key = id(node)
+        self._render_cache.pop(key, None)
+        try:
+            row = self._row_keys.index(key)
+        except ValueError:
+            return  # 节点不在当前显示的行中
+        self.dataChanged.emit(self.index(row, 4), self.index(row, 5))
+    
+    def invalidate_nodes(self, nodes: Iterable[Node]):
+        """批量丢弃节点的缓存显示文本，只通知视图一次（覆盖受影响行的范围）"""
+        keys = {id(node) for node in nodes}
+        for key in keys:
+            self._render_cache.pop(key, None)
+        rows = [row for row, key in enumerate(self._row_keys) if key in keys]
+        if rows:
+            # 本地端口、延迟两列
+            self.dataChanged.emit(self.index(rows[0], 4), self.index(rows[-1], 5))
+    
+    def set_filtered_indices(self, filtered_indices: List[int]) -> bool:
+        """设置过滤后的行索引，结果未变化时不更新模型；返回是否发生变化"""
+        if filtered_indices == self._filtered_indices:
+            return False
+        self._update_rows(filtered_indices)
+        return True
+    
+    def _update_rows(self, filtered_indices: List[int]):
+        """与当前显示的行比对，只插入/删除发生变化的行"""
+        self._filtered_indices = filtered_indices
+        nodes = self._t.nodes
+        new_rows = list(filtered_indices)
+        old_keys = self._row_keys
+        new_keys = [id(nodes[i]) for i in new_rows]
+        
+        if old_keys != new_keys:
+            matcher = difflib.SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+            # 倒序处理，保证前面的行号不受影响
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag == 'equal':
+                    continue
+                if i2 > i1:
+                    self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                    del self._rows[i1:i2]
+                    del self._row_keys[i1:i2]
+                    self.endRemoveRows()
+                if j2 > j1:
+                    self.beginInsertRows(QModelIndex(), i1, i1 + (j2 - j1) - 1)
+                    self._rows[i1:i1] = new_rows[j1:j2]
+                    self._row_keys[i1:i1] = new_keys[j1:j2]
+                    self.endInsertRows()
+        # 节点未变但节点表可能已重建，行索引以新结果为准
+        self._rows = new_rows
+        
+        # 保留的行可能有字段变化（延迟、端口等），序号列也可能移位，通知视图重绘
+        if self._rows:
+            last = len(self._rows) - 1
+            self.dataChanged.emit(self.index(0, 0), self.index(last, len(self.COLUMNS) - 1))
+    
+    def node_at(self, row: int) -> Node:
+        """获取指定行的节点"""
+        return self._t.nodes[self._rows[row]]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(row + 1)
+            return self._render_row(self._rows[row])[column - 1]
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._COL_ALIGN.get(column, self._ALIGN_DEFAULT)
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column == 5:
+                return self._latency_colors[self._t.latency_levels[self._rows[row]]]
+        return None
+    
+    def _render_row(self, i: int) -> Tuple[str, ...]:
+        """获取节点表第 i 行除序号外各列的显示文本（带缓存）"""
+        t = self._t
+        key = id(t.nodes[i])
+        cached = self._render_cache.get(key)
+        if cached is None:
+            local_port = t.local_ports[i]
+            cached = (
+                t.remarks[i],
+                t.addresses[i],
+                str(t.ports[i]),
+                str(local_port) if local_port else "-",
+                t.latency_displays[i],
+                t.protocols[i].upper(),
+            )
+            self._render_cache[key] = cached
+        return cached
+
+
+def setup_node_table_view(table: QTableView):
+    """按 NodeTableModel 的列配置表格视图的列宽和显示属性"""
+    # 表头设置（批量修改期间暂停表头重绘）
+    header = table.horizontalHeader()
+    header.setUpdatesEnabled(False)
+    try:
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        # 地址列使用固定宽度：ResizeToContents 会逐行取数据测量整列宽度
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
+        
+        table.setColumnWidth(0, 40)
+        table.setColumnWidth(2, 180)
+        table.setColumnWidth(3, 70)
+        table.setColumnWidth(4, 80)
+        table.setColumnWidth(5, 80)
+        table.setColumnWidth(6, 70)
+        
+        # 不排序、不拖动列
+        header.setSectionsMovable(False)
+        header.setSectionsClickable(False)
+    finally:
+        header.setUpdatesEnabled(True)
+    
+    # 固定行高，视图无需逐行计算尺寸
+    vertical_header = table.verticalHeader()
+    vertical_header.setVisible(False)
+    vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vertical_header.setDefaultSectionSize(32)
+    
+    # 表格属性
+    table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+    table.setAlternatingRowColors(True)
+    table.setShowGrid(False)
+    table.setWordWrap(False)
+    table.setTextElideMode(Qt.TextElideMode.ElideRight)  # 过长的域名地址省略显示
 
 
 class NodeListWidget(QFrame):
@@ -24,14 +326,33 @@ class NodeListWidget(QFrame):
     test_all = pyqtSignal()  # 测试所有节点
     selection_changed = pyqtSignal(list)  # 选中变化
     
+    # 搜索防抖间隔（毫秒）
+    SEARCH_DEBOUNCE_MS = 150
+    
+    # 搜索索引的片段长度，关键词不短于此长度时先用索引缩小范围
+    SEARCH_NGRAM_SIZE = 3
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("node_list_widget")
         
-        self._nodes: List[Node] = []
+        self._table = NodeTable()
+        self._remark_lower: List[str] = []  # 小写节点名称缓存，供搜索使用
+        self._table_index: Dict[int, int] = {}  # 节点标识 -> 节点表中的索引
+        self._ngram_index: Optional[Dict[str, Set[int]]] = None  # 名称片段索引，首次需要时构建
+        # 上一次搜索的关键词及结果：关键词继续追加字符时只需在上次结果中查找
+        self._last_filter = ""
+        self._last_filtered_indices: List[int] = []
+        
+        # 搜索防抖：连续输入只在停顿后刷新一次
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+        
         self._setup_ui()
+        self._setup_context_menu()
         self._apply_styles()
-        self._add_shadow()
     
     def _setup_ui(self):
         """设置 UI"""
@@ -41,6 +362,7 @@ class NodeListWidget(QFrame):
         
         # 工具栏
         toolbar = QWidget()
+        self._toolbar = toolbar
         toolbar.setObjectName("toolbar")
         toolbar.setFixedHeight(50)
         toolbar_layout = QHBoxLayout(toolbar)
@@ -70,206 +392,75 @@ class NodeListWidget(QFrame):
         layout.addWidget(toolbar)
         
         # 表格
-        self.table = QTableWidget()
+        self.table = QTableView()
         self.table.setObjectName("node_table")
+        self._model = NodeTableModel(self)
+        self.table.setModel(self._model)
         self._setup_table()
         layout.addWidget(self.table)
     
     def _setup_table(self):
         """设置表格"""
-        # 列配置
-        columns = ["", "节点名称", "地址", "端口", "本地端口", "延迟", "协议"]
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-        
-        # 表头设置
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)
-        
-        self.table.setColumnWidth(0, 40)
-        self.table.setColumnWidth(3, 70)
-        self.table.setColumnWidth(4, 80)
-        self.table.setColumnWidth(5, 80)
-        self.table.setColumnWidth(6, 70)
-        
-        # 表格属性
-        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.table.setAlternatingRowColors(True)
-        self.table.verticalHeader().setVisible(False)
-        self.table.setShowGrid(False)
+        setup_node_table_view(self.table)
         self.table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self._show_context_menu)
-        self.table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self._on_selection_changed)
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #node_list_widget {
-                background-color: rgba(30, 30, 50, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }
-            
-            #toolbar {
-                background: rgba(20, 20, 40, 0.5);
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-                border-top-left-radius: 16px;
-                border-top-right-radius: 16px;
-            }
-            
-            #search_input {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 8px;
-                padding: 6px 12px;
-                color: white;
-            }
-            
-            #search_input:focus {
-                border: 1px solid rgba(120, 0, 255, 0.5);
-            }
-            
-            #count_label {
-                color: rgba(255, 255, 255, 0.7);
-                padding: 0 15px;
-            }
-            
-            #action_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(120, 0, 255, 0.6),
-                    stop:1 rgba(0, 212, 255, 0.6)
-                );
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            
-            #action_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(140, 20, 255, 0.8),
-                    stop:1 rgba(20, 232, 255, 0.8)
-                );
-            }
-            
-            #node_table {
-                background: transparent;
-                border: none;
-                gridline-color: transparent;
-            }
-            
-            #node_table::item {
-                padding: 8px;
-                color: rgba(255, 255, 255, 0.9);
-            }
-            
-            #node_table::item:selected {
-                background: rgba(120, 0, 255, 0.3);
-            }
-            
-            #node_table::item:alternate {
-                background: rgba(255, 255, 255, 0.03);
-            }
-            
-            QHeaderView::section {
-                background: rgba(40, 40, 60, 0.8);
-                color: rgba(255, 255, 255, 0.8);
-                padding: 10px;
-                border: none;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-                font-weight: bold;
-            }
-        """)
-    
-    def _add_shadow(self):
-        """添加阴影"""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
+        self.setStyleSheet(_NODE_LIST_QSS)
+        self._toolbar.setStyleSheet(_TOOLBAR_QSS)
+        self.table.setStyleSheet(_NODE_TABLE_QSS)
     
     def set_nodes(self, nodes: List[Node]):
         """设置节点列表"""
-        self._nodes = nodes
+        self._table = NodeTable.from_nodes(nodes)
+        self._remark_lower = [r.lower() for r in self._table.remarks]
+        self._table_index = {id(node): i for i, node in enumerate(self._table.nodes)}
+        self._ngram_index = None
+        self._last_filter = ""
         self._refresh_table()
     
     def _refresh_table(self, filter_text: str = ""):
-        """刷新表格"""
-        self.table.setRowCount(0)
-        
-        filtered_nodes = self._nodes
-        if filter_text:
-            filter_text = filter_text.lower()
-            filtered_nodes = [n for n in self._nodes if filter_text in n.remark.lower()]
-        
-        for node in filtered_nodes:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            
-            # 序号
-            index_item = QTableWidgetItem(str(row + 1))
-            index_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, index_item)
-            
-            # 节点名称
-            name_item = QTableWidgetItem(node.remark)
-            self.table.setItem(row, 1, name_item)
-            
-            # 地址
-            addr_item = QTableWidgetItem(node.address)
-            self.table.setItem(row, 2, addr_item)
-            
-            # 端口
-            port_item = QTableWidgetItem(str(node.port))
-            port_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, port_item)
-            
-            # 本地端口
-            local_port = str(node.local_port) if node.local_port else "-"
-            local_item = QTableWidgetItem(local_port)
-            local_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, local_item)
-            
-            # 延迟
-            latency_item = QTableWidgetItem(node.latency_display)
-            latency_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._set_latency_color(latency_item, node.latency)
-            self.table.setItem(row, 5, latency_item)
-            
-            # 协议
-            protocol_item = QTableWidgetItem(node.protocol.upper())
-            protocol_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 6, protocol_item)
-        
-        self.count_label.setText(f"共 {len(filtered_nodes)} 个节点")
-    
-    def _set_latency_color(self, item: QTableWidgetItem, latency: Optional[int]):
-        """设置延迟颜色"""
-        if latency is None:
-            item.setForeground(QColor(150, 150, 150))
-        elif latency == -1:
-            item.setForeground(QColor(255, 100, 100))
-        elif latency < 100:
-            item.setForeground(QColor(100, 255, 150))
-        elif latency < 300:
-            item.setForeground(QColor(255, 220, 100))
-        else:
-            item.setForeground(QColor(255, 150, 100))
+        """刷新表格（批量更新期间暂停重绘）"""
+        filtered_indices = self._filter_indices(filter_text)
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._model.set_nodes(self._table, filtered_indices)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
+        self.count_label.setText(f"共 {len(filtered_indices)} 个节点")
+    
+    def _filter_indices(self, filter_text: str) -> List[int]:
+        """计算匹配搜索文本的节点索引"""
+        filter_text = filter_text.lower()
+        candidates = None
+        if self._last_filter and filter_text.startswith(self._last_filter):
+            candidates = self._last_filtered_indices
+        elif len(filter_text) >= self.SEARCH_NGRAM_SIZE:
+            # 无法沿用上次结果时（粘贴、删除字符等），用片段索引取候选
+            if self._ngram_index is None:
+                self._ngram_index = FilterEngine.build_ngram_index(
+                    self._remark_lower, self.SEARCH_NGRAM_SIZE
+                )
+            candidates = FilterEngine.ngram_candidates(
+                self._ngram_index, filter_text, self.SEARCH_NGRAM_SIZE
+            )
+        filtered_indices = FilterEngine.match_indices(self._remark_lower, filter_text, candidates)
+        self._last_filter = filter_text
+        self._last_filtered_indices = filtered_indices
+        return filtered_indices
     
     def _on_search(self, text: str):
-        """搜索处理"""
-        self._refresh_table(text)
+        """搜索处理（重新开始防抖计时）"""
+        self._search_timer.start()
+    
+    def _apply_search(self):
+        """按当前搜索文本过滤表格（节点数据未变，只更新可见行）"""
+        filtered_indices = self._filter_indices(self.search_input.text())
+        if self._model.set_filtered_indices(filtered_indices):
+            self.count_label.setText(f"共 {len(filtered_indices)} 个节点")
     
     def _on_test_clicked(self):
         """测试按钮点击"""
@@ -283,52 +474,50 @@ class NodeListWidget(QFrame):
         """选中变化"""
         self.selection_changed.emit(self.get_selected_nodes())
     
-    def _show_context_menu(self, pos: QPoint):
-        """显示右键菜单"""
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background: rgba(30, 30, 50, 0.95);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 8px 20px;
-                color: rgba(255, 255, 255, 0.9);
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background: rgba(120, 0, 255, 0.4);
-            }
-        """)
-        
-        test_action = QAction("⚡ 测试选中节点", self)
-        test_action.triggered.connect(lambda: self.test_selected.emit(self.get_selected_nodes()))
-        menu.addAction(test_action)
+    def _setup_context_menu(self):
+        """构建右键菜单（只构建一次）"""
+        self._ctx_menu = QMenu(self)
+        self._ctx_menu.setStyleSheet(_MENU_QSS)
         
-        test_all_action = QAction("↻ 测试所有节点", self)
-        test_all_action.triggered.connect(self.test_all.emit)
-        menu.addAction(test_all_action)
+        self._test_action = QAction("⚡ 测试选中节点", self)
+        self._test_action.triggered.connect(self._emit_test_selected)
+        self._ctx_menu.addAction(self._test_action)
         
-        menu.exec(self.table.mapToGlobal(pos))
+        self._test_all_action = QAction("↻ 测试所有节点", self)
+        self._test_all_action.triggered.connect(self.test_all.emit)
+        self._ctx_menu.addAction(self._test_all_action)
+    
+    def _show_context_menu(self, pos: QPoint):
+        """显示右键菜单"""
+        self._ctx_menu.exec(self.table.mapToGlobal(pos))
+    
+    def _emit_test_selected(self):
+        """请求测试选中节点（在触发时读取选中项）"""
+        self.test_selected.emit(self.get_selected_nodes())
     
     def get_selected_nodes(self) -> List[Node]:
         """获取选中的节点"""
-        selected_rows = set()
-        for item in self.table.selectedItems():
-            selected_rows.add(item.row())
-        
-        # 根据搜索过滤后的索引获取节点
-        filter_text = self.search_input.text().lower()
-        if filter_text:
-            filtered_nodes = [n for n in self._nodes if filter_text in n.remark.lower()]
-        else:
-            filtered_nodes = self._nodes
-        
-        return [filtered_nodes[row] for row in sorted(selected_rows) if row < len(filtered_nodes)]
+        rows = sorted(index.row() for index in self.table.selectionModel().selectedRows())
+        return [self._model.node_at(row) for row in rows]
     
     def update_node_latency(self, node: Node, latency: Optional[int]):
         """更新节点延迟"""
         node.latency = latency
-        self._refresh_table(self.search_input.text())
+        i = self._table_index.get(id(node))
+        if i is None:
+            return
+        # 只刷新该节点的列和所在行；过滤结果只取决于节点名称，无需重新过滤
+        self._table.refresh_row(i)
+        self._model.invalidate_node(node)
+    
+    def update_node_latencies(self, updates: Iterable[Tuple[Node, Optional[int]]]):
+        """批量更新节点延迟，所有节点更新后只通知视图一次"""
+        changed = []
+        for node, latency in updates:
+            node.latency = latency
+            i = self._table_index.get(id(node))
+            if i is not None:
+                self._table.refresh_row(i)
+                changed.append(node)
+        if changed:
+            self._model.invalidate_nodes(changed)
@@ -4,11 +4,184 @@
 from PyQt6.QtWidgets import (
     QDialog, QFrame, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QWidget, QSpinBox,
-    QCheckBox, QGraphicsDropShadowEffect, QScrollArea,
+    QCheckBox, QScrollArea,
     QTextEdit
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QFont
+
+import functools
+from typing import List, Tuple
+
+
+# 标题字体（模块级共享，setFont 会复制字体，可安全复用）
+_SECTION_TITLE_FONT = QFont("Segoe UI", 11, QFont.Weight.Bold)
+_DIALOG_TITLE_FONT = QFont("Segoe UI", 13, QFont.Weight.Bold)
+
+# 设置分组样式表（模块级常量，只构建一次）
+_SECTION_QSS = """
+    #settings_section {
+        background: rgba(30, 20, 50, 0.6);
+        border: 1px solid rgba(120, 0, 255, 0.2);
+        border-radius: 12px;
+    }
+
+    #section_title {
+        color: rgba(200, 150, 255, 0.95);
+    }
+"""
+
+# 设置对话框外框样式表
+# 标题栏、滚动区域和底部按钮栏的样式分别设置在各自控件上，减少每个子控件需要匹配的选择器
+_SETTINGS_DIALOG_QSS = """
+    #settings_dialog {
+        background: rgba(20, 15, 40, 0.98);
+        border: 1px solid rgba(120, 0, 255, 0.4);
+        border-radius: 16px;
+    }
+"""
+
+# 对话框标题栏样式表
+_TITLE_BAR_QSS = """
+    #dialog_title_bar {
+        background: rgba(30, 20, 50, 0.9);
+        border-bottom: 1px solid rgba(120, 0, 255, 0.3);
+        border-top-left-radius: 16px;
+        border-top-right-radius: 16px;
+    }
+
+    #dialog_title {
+        color: rgba(255, 255, 255, 0.95);
+    }
+
+    #dialog_close_btn {
+        background: transparent;
+        border: none;
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 18px;
+        border-radius: 4px;
+    }
+
+    #dialog_close_btn:hover {
+        background: rgba(255, 80, 80, 0.8);
+        color: white;
+    }
+"""
+
+# 滚动区域样式表（各设置分组中的输入控件）
+_SCROLL_QSS = """
+    #settings_scroll {
+        background: transparent;
+        border: none;
+    }
+
+    #scroll_content {
+        background: transparent;
+    }
+
+    #field_label {
+        color: rgba(255, 255, 255, 0.7);
+    }
+
+    #spin_box {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: white;
+        min-width: 120px;
+    }
+
+    #spin_box:focus {
+        border: 1px solid rgba(120, 0, 255, 0.6);
+    }
+
+    #text_edit {
+        background: rgba(40, 30, 60, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 8px;
+        padding: 8px;
+        color: white;
+    }
+
+    #text_edit:focus {
+        border: 1px solid rgba(120, 0, 255, 0.6);
+    }
+
+    #check_box {
+        color: rgba(255, 255, 255, 0.85);
+        spacing: 8px;
+    }
+
+    #check_box::indicator {
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+        border: 1px solid rgba(120, 0, 255, 0.4);
+        background: rgba(40, 30, 60, 0.8);
+    }
+
+    #check_box::indicator:checked {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 #7800ff,
+            stop:1 #00d4ff
+        );
+        border: none;
+    }
+"""
+
+# 底部按钮栏样式表
+_BUTTON_BAR_QSS = """
+    #btn_bar {
+        background: rgba(30, 20, 50, 0.9);
+        border-top: 1px solid rgba(120, 0, 255, 0.3);
+        border-bottom-left-radius: 16px;
+        border-bottom-right-radius: 16px;
+    }
+
+    #cancel_btn {
+        background: rgba(60, 50, 80, 0.8);
+        border: 1px solid rgba(120, 0, 255, 0.3);
+        border-radius: 8px;
+        color: rgba(255, 255, 255, 0.8);
+    }
+
+    #cancel_btn:hover {
+        background: rgba(80, 70, 100, 0.9);
+    }
+
+    #save_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(120, 0, 255, 0.8),
+            stop:1 rgba(0, 180, 255, 0.8)
+        );
+        border: none;
+        border-radius: 8px;
+        color: white;
+        font-weight: bold;
+    }
+
+    #save_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(140, 20, 255, 0.9),
+            stop:1 rgba(20, 200, 255, 0.9)
+        );
+    }
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_lines(text: str) -> Tuple[str, ...]:
+    """按行拆分文本，去除首尾空白并丢弃空行（按文本缓存，内容未变时不重复解析）"""
+    return tuple(line for line in (raw.strip() for raw in text.split('\n')) if line)
+
+
+def _non_empty_lines(text: str) -> List[str]:
+    """获取文本中的非空行（返回新列表，调用方可自由修改）"""
+    return list(_parse_lines(text))
 
 
 class SettingsSection(QFrame):
@@ -33,8 +206,7 @@ class SettingsSection(QFrame):
         title_text = f"{self._icon} {self._title}" if self._icon else self._title
         title_label = QLabel(title_text)
         title_label.setObjectName("section_title")
-        title_font = QFont("Segoe UI", 11, QFont.Weight.Bold)
-        title_label.setFont(title_font)
+        title_label.setFont(_SECTION_TITLE_FONT)
         self.main_layout.addWidget(title_label)
         
         # 内容容器
@@ -46,17 +218,7 @@ class SettingsSection(QFrame):
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #settings_section {
-                background: rgba(30, 20, 50, 0.6);
-                border: 1px solid rgba(120, 0, 255, 0.2);
-                border-radius: 12px;
-            }
-            
-            #section_title {
-                color: rgba(200, 150, 255, 0.95);
-            }
-        """)
+        self.setStyleSheet(_SECTION_QSS)
     
     def add_widget(self, widget: QWidget):
         """添加组件"""
@@ -92,11 +254,12 @@ class SettingsDialog(QDialog):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         self._drag_pos = None
+        self._sections_built = False  # 设置分组在首次显示或读写设置时构建
         self._setup_ui()
         self._apply_styles()
     
     def _setup_ui(self):
-        """设置 UI"""
+        """设置 UI（设置分组延迟到 _ensure_sections 中构建）"""
         # 主容器
         main_widget = QFrame(self)
         main_widget.setObjectName("settings_dialog")
@@ -108,6 +271,7 @@ class SettingsDialog(QDialog):
         
         # 标题栏
         title_bar = QFrame()
+        self._title_bar = title_bar
         title_bar.setObjectName("dialog_title_bar")
         title_bar.setFixedHeight(45)
         title_layout = QHBoxLayout(title_bar)
@@ -115,8 +279,7 @@ class SettingsDialog(QDialog):
         
         title = QLabel("⚙ 设置")
         title.setObjectName("dialog_title")
-        title_font = QFont("Segoe UI", 13, QFont.Weight.Bold)
-        title.setFont(title_font)
+        title.setFont(_DIALOG_TITLE_FONT)
         title_layout.addWidget(title)
         
         title_layout.addStretch()
@@ -131,6 +294,7 @@ class SettingsDialog(QDialog):
         
         # 滚动区域
         scroll = QScrollArea()
+        self._scroll = scroll
         scroll.setObjectName("settings_scroll")
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -141,28 +305,12 @@ class SettingsDialog(QDialog):
         self.scroll_layout.setContentsMargins(15, 10, 15, 15)
         self.scroll_layout.setSpacing(12)
         
-        # 端口设置
-        self._create_port_section()
-        
-        # 过滤设置
-        self._create_filter_section()
-        
-        # 排序设置
-        self._create_sort_section()
-        
-        # 定时刷新设置
-        self._create_refresh_section()
-        
-        # 其他设置
-        self._create_other_section()
-        
-        self.scroll_layout.addStretch()
-        
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
         
         # 底部按钮
         btn_widget = QFrame()
+        self._btn_bar = btn_widget
         btn_widget.setObjectName("btn_bar")
         btn_widget.setFixedHeight(55)
         btn_layout = QHBoxLayout(btn_widget)
@@ -183,13 +331,34 @@ class SettingsDialog(QDialog):
         btn_layout.addWidget(save_btn)
         
         layout.addWidget(btn_widget)
+    
+    def _ensure_sections(self):
+        """构建各设置分组（只构建一次）"""
+        if self._sections_built:
+            return
+        self._sections_built = True
         
-        # 添加阴影
-        shadow = QGraphicsDropShadowEffect(main_widget)
-        shadow.setBlurRadius(30)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(0, 5)
-        main_widget.setGraphicsEffect(shadow)
+        # 端口设置
+        self._create_port_section()
+        
+        # 过滤设置
+        self._create_filter_section()
+        
+        # 排序设置
+        self._create_sort_section()
+        
+        # 定时刷新设置
+        self._create_refresh_section()
+        
+        # 其他设置
+        self._create_other_section()
+        
+        self.scroll_layout.addStretch()
+    
+    def showEvent(self, event):
+        """首次显示时构建设置分组"""
+        self._ensure_sections()
+        super().showEvent(event)
     
     def _create_port_section(self):
         """创建端口设置"""
@@ -282,135 +451,10 @@ class SettingsDialog(QDialog):
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #settings_dialog {
-                background: rgba(20, 15, 40, 0.98);
-                border: 1px solid rgba(120, 0, 255, 0.4);
-                border-radius: 16px;
-            }
-            
-            #dialog_title_bar {
-                background: rgba(30, 20, 50, 0.9);
-                border-bottom: 1px solid rgba(120, 0, 255, 0.3);
-                border-top-left-radius: 16px;
-                border-top-right-radius: 16px;
-            }
-            
-            #dialog_title {
-                color: rgba(255, 255, 255, 0.95);
-            }
-            
-            #dialog_close_btn {
-                background: transparent;
-                border: none;
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 18px;
-                border-radius: 4px;
-            }
-            
-            #dialog_close_btn:hover {
-                background: rgba(255, 80, 80, 0.8);
-                color: white;
-            }
-            
-            #settings_scroll {
-                background: transparent;
-                border: none;
-            }
-            
-            #scroll_content {
-                background: transparent;
-            }
-            
-            #field_label {
-                color: rgba(255, 255, 255, 0.7);
-            }
-            
-            #spin_box {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: white;
-                min-width: 120px;
-            }
-            
-            #spin_box:focus {
-                border: 1px solid rgba(120, 0, 255, 0.6);
-            }
-            
-            #text_edit {
-                background: rgba(40, 30, 60, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 8px;
-                padding: 8px;
-                color: white;
-            }
-            
-            #text_edit:focus {
-                border: 1px solid rgba(120, 0, 255, 0.6);
-            }
-            
-            #check_box {
-                color: rgba(255, 255, 255, 0.85);
-                spacing: 8px;
-            }
-            
-            #check_box::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: 1px solid rgba(120, 0, 255, 0.4);
-                background: rgba(40, 30, 60, 0.8);
-            }
-            
-            #check_box::indicator:checked {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #7800ff,
-                    stop:1 #00d4ff
-                );
-                border: none;
-            }
-            
-            #btn_bar {
-                background: rgba(30, 20, 50, 0.9);
-                border-top: 1px solid rgba(120, 0, 255, 0.3);
-                border-bottom-left-radius: 16px;
-                border-bottom-right-radius: 16px;
-            }
-            
-            #cancel_btn {
-                background: rgba(60, 50, 80, 0.8);
-                border: 1px solid rgba(120, 0, 255, 0.3);
-                border-radius: 8px;
-                color: rgba(255, 255, 255, 0.8);
-            }
-            
-            #cancel_btn:hover {
-                background: rgba(80, 70, 100, 0.9);
-            }
-            
-            #save_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(120, 0, 255, 0.8),
-                    stop:1 rgba(0, 180, 255, 0.8)
-                );
-                border: none;
-                border-radius: 8px;
-                color: white;
-                font-weight: bold;
-            }
-            
-            #save_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(140, 20, 255, 0.9),
-                    stop:1 rgba(20, 200, 255, 0.9)
-                );
-            }
-        """)
+        self.setStyleSheet(_SETTINGS_DIALOG_QSS)
+        self._title_bar.setStyleSheet(_TITLE_BAR_QSS)
+        self._scroll.setStyleSheet(_SCROLL_QSS)
+        self._btn_bar.setStyleSheet(_BUTTON_BAR_QSS)
     
     def _on_save(self):
         """保存设置"""
@@ -419,11 +463,12 @@ class SettingsDialog(QDialog):
     
     def get_settings(self) -> dict:
         """获取设置"""
+        self._ensure_sections()
         return {
             'start_port': self.start_port_spin.value(),
             'port_count': self.port_count_spin.value(),
-            'exclude_keywords': [k.strip() for k in self.exclude_keywords.toPlainText().split('\n') if k.strip()],
-            'region_priority': [r.strip() for r in self.region_priority.toPlainText().split('\n') if r.strip()],
+            'exclude_keywords': _non_empty_lines(self.exclude_keywords.toPlainText()),
+            'region_priority': _non_empty_lines(self.region_priority.toPlainText()),
             'sort_by_speed': self.sort_by_speed.isChecked(),
             'auto_refresh': self.auto_refresh.isChecked(),
             'refresh_interval': self.refresh_interval.value(),
@@ -433,6 +478,7 @@ class SettingsDialog(QDialog):
     
     def set_settings(self, settings: dict):
         """设置配置"""
+        self._ensure_sections()
         if 'start_port' in settings:
             self.start_port_spin.setValue(settings['start_port'])
         if 'port_count' in settings:
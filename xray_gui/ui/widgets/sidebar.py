@@ -1,12 +1,127 @@
 """
 侧边栏导航组件
 """
+from typing import Dict, Sequence, Tuple
+
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QWidget, QGraphicsDropShadowEffect
+    QPushButton, QWidget
 )
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, pyqtSignal, QSize
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtGui import QFont, QFontMetrics, QPainter, QLinearGradient, QColor, QPixmap
+
+
+# 侧边栏字体（模块级共享，导航项之间复用同一组字体）
+_ICON_FONT = QFont("Segoe UI Emoji", 14)
+_TEXT_FONT = QFont("Segoe UI", 11)
+_LOGO_FONT = QFont("Segoe UI Emoji", 28)
+_APP_NAME_FONT = QFont("Segoe UI", 12, QFont.Weight.Bold)
+_STATUS_FONT = QFont("Segoe UI", 10)
+
+# 图标字符颜色（导航项未选中/选中、Logo）
+_ICON_COLOR = QColor(255, 255, 255, 178)
+_ICON_SELECTED_COLOR = QColor(255, 255, 255, 242)
+_LOGO_COLOR = QColor(255, 255, 255)
+
+# 图标字符预渲染缓存：(字符, 字体, 颜色, 缩放比) -> QPixmap
+_glyph_cache: Dict[Tuple[str, str, int, float], QPixmap] = {}
+
+
+def _glyph_pixmap(glyph: str, font: QFont, color: QColor, ratio: float) -> QPixmap:
+    """把图标字符渲染成透明背景的 QPixmap（同一图标只渲染一次，之后不再走彩色字体排版）"""
+    key = (glyph, font.key(), color.rgba(), ratio)
+    pixmap = _glyph_cache.get(key)
+    if pixmap is None:
+        # 与文本 QLabel 的建议尺寸一致（字符尺寸各加 1px），替换后布局不变
+        metrics = QFontMetrics(font)
+        width = metrics.horizontalAdvance(glyph) + 1
+        height = metrics.height() + 1
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(0, 0, width, height, Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        _glyph_cache[key] = pixmap
+    return pixmap
+
+
+# 侧边栏样式表（模块级常量，只构建一次；导航项按 selected 属性匹配）
+_SIDEBAR_QSS = """
+    #sidebar {
+        background-color: rgba(20, 20, 40, 0.7);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+    }
+
+    #app_name {
+        color: rgba(255, 255, 255, 0.9);
+    }
+
+    #status_label {
+        color: rgba(255, 100, 100, 0.8);
+    }
+
+    #status_label[running="true"] {
+        color: rgba(100, 255, 150, 0.9);
+    }
+
+    #sidebar_item {
+        background: transparent;
+        border: none;
+        border-radius: 12px;
+    }
+
+    #sidebar_item[selected="false"]:hover {
+        background: rgba(255, 255, 255, 0.08);
+    }
+
+    #sidebar_item[selected="true"] {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(120, 0, 255, 0.4),
+            stop:1 rgba(0, 212, 255, 0.2)
+        );
+    }
+
+    #item_text {
+        color: rgba(255, 255, 255, 0.7);
+    }
+
+    #sidebar_item[selected="true"] #item_text {
+        color: rgba(255, 255, 255, 0.95);
+    }
+
+    #indicator {
+        background: qlineargradient(
+            x1:0, y1:0, x2:0, y2:1,
+            stop:0 #7800ff,
+            stop:1 #00d4ff
+        );
+        border-radius: 2px;
+    }
+"""
+
+
+class _GradientSeparator(QFrame):
+    """两端渐隐的 1px 分隔线（直接绘制，不参与样式表匹配）"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(1)
+        # 渐变按控件自身尺寸计算，只需构建一次
+        self._grad = QLinearGradient(0, 0, 1, 0)
+        self._grad.setCoordinateMode(QLinearGradient.CoordinateMode.ObjectBoundingMode)
+        self._grad.setColorAt(0, QColor(0, 0, 0, 0))
+        self._grad.setColorAt(0.5, QColor(255, 255, 255, 51))
+        self._grad.setColorAt(1, QColor(0, 0, 0, 0))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._grad)
+        painter.end()
 
 
 class SidebarItem(QFrame):
@@ -32,23 +147,24 @@ class SidebarItem(QFrame):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(15, 8, 15, 8)
         layout.setSpacing(12)
+        self._styled_widgets = [self]  # 选中状态变化时需要重新应用样式的控件
         
-        # 图标
+        # 图标（预渲染的字符图片，选中状态切换时只换图片）
         if self._icon:
-            self.icon_label = QLabel(self._icon)
+            self.icon_label = QLabel()
             self.icon_label.setObjectName("item_icon")
             self.icon_label.setFixedWidth(24)
             self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            icon_font = QFont("Segoe UI Emoji", 14)
-            self.icon_label.setFont(icon_font)
+            self._update_icon()
             layout.addWidget(self.icon_label)
         
         # 文本
         self.text_label = QLabel(self._text)
+        self.text_label.setTextFormat(Qt.TextFormat.PlainText)
         self.text_label.setObjectName("item_text")
-        text_font = QFont("Segoe UI", 11)
-        self.text_label.setFont(text_font)
+        self.text_label.setFont(_TEXT_FONT)
         layout.addWidget(self.text_label)
+        self._styled_widgets.append(self.text_label)
         
         layout.addStretch()
         
@@ -60,53 +176,31 @@ class SidebarItem(QFrame):
         layout.addWidget(self.indicator)
     
     def _apply_styles(self):
-        """应用样式"""
-        self._update_style()
+        """应用样式（样式规则统一放在 Sidebar 的样式表中，按 selected 属性匹配）"""
+        self.setProperty("selected", self._selected)
+    
+    def _update_icon(self):
+        """按选中状态设置图标图片"""
+        color = _ICON_SELECTED_COLOR if self._selected else _ICON_COLOR
+        self.icon_label.setPixmap(
+            _glyph_pixmap(self._icon, _ICON_FONT, color, self.icon_label.devicePixelRatioF())
+        )
     
     def _update_style(self):
-        """更新样式"""
-        if self._selected:
-            self.setStyleSheet("""
-                #sidebar_item {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:1, y2:0,
-                        stop:0 rgba(120, 0, 255, 0.4),
-                        stop:1 rgba(0, 212, 255, 0.2)
-                    );
-                    border: none;
-                    border-radius: 12px;
-                }
-                #item_icon, #item_text {
-                    color: rgba(255, 255, 255, 0.95);
-                }
-                #indicator {
-                    background: qlineargradient(
-                        x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #7800ff,
-                        stop:1 #00d4ff
-                    );
-                    border-radius: 2px;
-                }
-            """)
-            self.indicator.setVisible(True)
-        else:
-            self.setStyleSheet("""
-                #sidebar_item {
-                    background: transparent;
-                    border: none;
-                    border-radius: 12px;
-                }
-                #sidebar_item:hover {
-                    background: rgba(255, 255, 255, 0.08);
-                }
-                #item_icon, #item_text {
-                    color: rgba(255, 255, 255, 0.7);
-                }
-            """)
-            self.indicator.setVisible(False)
+        """选中状态变化后重新应用样式（只重新匹配规则，不重新解析样式表）"""
+        self.setProperty("selected", self._selected)
+        # 子标签的颜色规则依赖本控件的属性，需要一并重新匹配
+        for widget in self._styled_widgets:
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+        if self._icon:
+            self._update_icon()
+        self.indicator.setVisible(self._selected)
     
     def set_selected(self, selected: bool):
-        """设置选中状态"""
+        """设置选中状态（状态不变时不重新应用样式）"""
+        if selected == self._selected:
+            return
         self._selected = selected
         self._update_style()
     
@@ -139,10 +233,10 @@ class Sidebar(QFrame):
         
         self._items: list[SidebarItem] = []
         self._current_index = 0
+        self._running = False
         
         self._setup_ui()
         self._apply_styles()
-        self._add_shadow()
     
     def _setup_ui(self):
         """设置 UI"""
@@ -155,27 +249,25 @@ class Sidebar(QFrame):
         logo_layout = QVBoxLayout(logo_widget)
         logo_layout.setContentsMargins(10, 5, 10, 15)
         
-        logo_label = QLabel("☆")
+        logo_label = QLabel()
         logo_label.setObjectName("logo")
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        logo_font = QFont("Segoe UI Emoji", 28)
-        logo_label.setFont(logo_font)
+        logo_label.setPixmap(
+            _glyph_pixmap("☆", _LOGO_FONT, _LOGO_COLOR, logo_label.devicePixelRatioF())
+        )
         logo_layout.addWidget(logo_label)
         
         app_name = QLabel("Xray GUI")
+        app_name.setTextFormat(Qt.TextFormat.PlainText)
         app_name.setObjectName("app_name")
         app_name.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_font = QFont("Segoe UI", 12, QFont.Weight.Bold)
-        app_name.setFont(name_font)
+        app_name.setFont(_APP_NAME_FONT)
         logo_layout.addWidget(app_name)
         
         self.main_layout.addWidget(logo_widget)
         
         # 分隔线
-        separator = QFrame()
-        separator.setObjectName("separator")
-        separator.setFixedHeight(1)
-        self.main_layout.addWidget(separator)
+        self.main_layout.addWidget(_GradientSeparator())
         
         # 导航项容器
         self.items_widget = QWidget()
@@ -192,88 +284,80 @@ class Sidebar(QFrame):
         status_layout.setContentsMargins(10, 10, 10, 5)
         
         self.status_label = QLabel("● 已停止")
+        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
         self.status_label.setObjectName("status_label")
+        self.status_label.setProperty("running", False)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_font = QFont("Segoe UI", 10)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_STATUS_FONT)
         status_layout.addWidget(self.status_label)
         
         self.main_layout.addWidget(self.status_widget)
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #sidebar {
-                background-color: rgba(20, 20, 40, 0.7);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }
-            
-            #logo {
-                color: white;
-            }
-            
-            #app_name {
-                color: rgba(255, 255, 255, 0.9);
-            }
-            
-            #separator {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 transparent,
-                    stop:0.5 rgba(255, 255, 255, 0.2),
-                    stop:1 transparent
-                );
-            }
-            
-            #status_label {
-                color: rgba(255, 100, 100, 0.8);
-            }
-        """)
-    
-    def _add_shadow(self):
-        """添加阴影效果"""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(2, 2)
-        self.setGraphicsEffect(shadow)
+        self.setStyleSheet(_SIDEBAR_QSS)
     
     def add_item(self, text: str, icon: str = ""):
         """添加导航项"""
-        item = SidebarItem(text, icon)
-        item.clicked.connect(lambda: self._on_item_clicked(item))
-        
-        self.items_layout.addWidget(item)
-        self._items.append(item)
+        self._append_items([(text, icon)])
+    
+    def set_items(self, items: Sequence[Tuple[str, str]]):
+        """
+        批量设置导航项（替换现有导航项，整批只刷新一次）
         
-        # 第一个项默认选中
-        if len(self._items) == 1:
-            item.set_selected(True)
+        Args:
+            items: (文本, 图标) 列表
+        """
+        for item in self._items:
+            self.items_layout.removeWidget(item)
+            item.deleteLater()
+        self._items = []
+        self._current_index = 0
+        self._append_items(items)
+    
+    def _append_items(self, items: Sequence[Tuple[str, str]]):
+        """创建并追加导航项（期间暂停容器重绘，结束后统一刷新）"""
+        self.items_widget.setUpdatesEnabled(False)
+        try:
+            for text, icon in items:
+                item = SidebarItem(text, icon)
+                # 连接时记录序号，点击时无需在列表中查找
+                index = len(self._items)
+                item.clicked.connect(lambda index=index: self._on_item_clicked(index))
+                
+                self.items_layout.addWidget(item)
+                self._items.append(item)
+                
+                # 第一个项默认选中
+                if index == 0:
+                    item.set_selected(True)
+        finally:
+            self.items_widget.setUpdatesEnabled(True)
     
-    def _on_item_clicked(self, item: SidebarItem):
+    def _on_item_clicked(self, index: int):
         """导航项点击处理"""
-        index = self._items.index(item)
         if index != self._current_index:
             # 取消之前的选中
             if 0 <= self._current_index < len(self._items):
                 self._items[self._current_index].set_selected(False)
             
             # 选中新项
-            item.set_selected(True)
+            self._items[index].set_selected(True)
             self._current_index = index
             self.page_changed.emit(index)
     
     def set_current_index(self, index: int):
         """设置当前选中项"""
         if 0 <= index < len(self._items):
-            self._on_item_clicked(self._items[index])
+            self._on_item_clicked(index)
     
     def set_status(self, running: bool):
-        """设置运行状态"""
-        if running:
-            self.status_label.setText("● 运行中")
-            self.status_label.setStyleSheet("color: rgba(100, 255, 150, 0.9);")
-        else:
-            self.status_label.setText("● 已停止")
-            self.status_label.setStyleSheet("color: rgba(255, 100, 100, 0.8);")
+        """设置运行状态（状态不变时直接返回）"""
+        if running == self._running:
+            return
+        self._running = running
+        self.status_label.setText("● 运行中" if running else "● 已停止")
+        # 颜色由样式表按 running 属性匹配，属性变化后重新应用样式
+        self.status_label.setProperty("running", running)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
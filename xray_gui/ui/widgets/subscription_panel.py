@@ -4,10 +4,114 @@
 from PyQt6.QtWidgets import (
     QFrame, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QWidget, QTextEdit,
-    QGraphicsDropShadowEffect, QProgressBar
+    QProgressBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, QSignalBlocker, QTimer
+from PyQt6.QtGui import QFont
+
+
+# 标题与统计数值字体（模块级共享，setFont 会复制字体，可安全复用）
+_TITLE_FONT = QFont("Segoe UI", 14, QFont.Weight.Bold)
+_STAT_VALUE_FONT = QFont("Segoe UI", 18, QFont.Weight.Bold)
+
+# 订阅面板样式表（模块级常量，只构建一次）
+_SUBSCRIPTION_PANEL_QSS = """
+    #subscription_panel {
+        background-color: rgba(30, 30, 50, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 16px;
+    }
+
+    #panel_title {
+        color: rgba(255, 255, 255, 0.95);
+        padding-bottom: 10px;
+    }
+
+    #field_label {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 12px;
+    }
+
+    #url_input {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 10px;
+        padding: 12px 15px;
+        color: white;
+        font-size: 13px;
+    }
+
+    #url_input:focus {
+        border: 1px solid rgba(120, 0, 255, 0.5);
+        background: rgba(255, 255, 255, 0.12);
+    }
+
+    #refresh_btn {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(120, 0, 255, 0.7),
+            stop:1 rgba(0, 212, 255, 0.7)
+        );
+        border: none;
+        border-radius: 10px;
+        padding: 12px;
+        color: white;
+        font-weight: bold;
+        font-size: 13px;
+    }
+
+    #refresh_btn:hover {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:1,
+            stop:0 rgba(140, 20, 255, 0.9),
+            stop:1 rgba(20, 232, 255, 0.9)
+        );
+    }
+
+    #refresh_btn:disabled {
+        background: rgba(100, 100, 100, 0.5);
+    }
+
+    #progress_bar {
+        background: rgba(255, 255, 255, 0.1);
+        border: none;
+        border-radius: 2px;
+    }
+
+    #progress_bar::chunk {
+        background: qlineargradient(
+            x1:0, y1:0, x2:1, y2:0,
+            stop:0 #7800ff,
+            stop:1 #00d4ff
+        );
+        border-radius: 2px;
+    }
+
+    #status_label {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 12px;
+    }
+
+    #stat_card {
+        background: rgba(40, 40, 60, 0.5);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 12px;
+    }
+
+    #stat_value {
+        color: rgba(255, 255, 255, 0.95);
+    }
+
+    #stat_label {
+        color: rgba(255, 255, 255, 0.6);
+        font-size: 11px;
+    }
+"""
+
+
+# 状态信息颜色
+_STATUS_ERROR_QSS = "color: rgba(255, 100, 100, 0.9);"
+_STATUS_OK_QSS = "color: rgba(100, 255, 150, 0.9);"
 
 
 class SubscriptionPanel(QFrame):
@@ -15,15 +119,25 @@ class SubscriptionPanel(QFrame):
     
     # 信号
     refresh_requested = pyqtSignal(str)  # 刷新订阅
-    url_changed = pyqtSignal(str)  # URL 变化
+    url_changed = pyqtSignal(str)  # URL 变化（去除首尾空白，输入停顿后发出）
+    
+    # 地址输入防抖间隔（毫秒）
+    URL_DEBOUNCE_MS = 300
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("subscription_panel")
+        self._url = ""  # 当前地址（已去除首尾空白）
+        self._last_emitted_url = ""  # 上次通过 url_changed 发出（或程序设置）的地址
+        
+        # 地址防抖：连续输入/粘贴只在停顿后发出一次 url_changed
+        self._url_timer = QTimer(self)
+        self._url_timer.setSingleShot(True)
+        self._url_timer.setInterval(self.URL_DEBOUNCE_MS)
+        self._url_timer.timeout.connect(self._emit_url_changed)
         
         self._setup_ui()
         self._apply_styles()
-        self._add_shadow()
     
     def _setup_ui(self):
         """设置 UI"""
@@ -33,9 +147,9 @@ class SubscriptionPanel(QFrame):
         
         # 标题
         title = QLabel("↓ 订阅管理")
+        title.setTextFormat(Qt.TextFormat.PlainText)
         title.setObjectName("panel_title")
-        title_font = QFont("Segoe UI", 14, QFont.Weight.Bold)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
         
         # 订阅 URL 输入区域
@@ -45,6 +159,7 @@ class SubscriptionPanel(QFrame):
         url_layout.setSpacing(8)
         
         url_label = QLabel("订阅地址")
+        url_label.setTextFormat(Qt.TextFormat.PlainText)
         url_label.setObjectName("field_label")
         url_layout.addWidget(url_label)
         
@@ -55,7 +170,7 @@ class SubscriptionPanel(QFrame):
         self.url_input = QLineEdit()
         self.url_input.setObjectName("url_input")
         self.url_input.setPlaceholderText("请输入订阅地址 (支持 Base64 编码)")
-        self.url_input.textChanged.connect(lambda t: self.url_changed.emit(t))
+        self.url_input.textChanged.connect(self._on_url_text_changed)
         input_row.addWidget(self.url_input)
         
         self.refresh_btn = QPushButton("↻ 刷新")
@@ -78,6 +193,7 @@ class SubscriptionPanel(QFrame):
         
         # 状态信息
         self.status_label = QLabel("")
+        self.status_label.setTextFormat(Qt.TextFormat.PlainText)
         self.status_label.setObjectName("status_label")
         layout.addWidget(self.status_label)
         
@@ -115,13 +231,14 @@ class SubscriptionPanel(QFrame):
         card_layout.setSpacing(5)
         
         value_label = QLabel(value)
+        value_label.setTextFormat(Qt.TextFormat.PlainText)
         value_label.setObjectName("stat_value")
-        value_font = QFont("Segoe UI", 18, QFont.Weight.Bold)
-        value_label.setFont(value_font)
+        value_label.setFont(_STAT_VALUE_FONT)
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         card_layout.addWidget(value_label)
         
         label_widget = QLabel(label)
+        label_widget.setTextFormat(Qt.TextFormat.PlainText)
         label_widget.setObjectName("stat_label")
         label_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
         card_layout.addWidget(label_widget)
@@ -133,120 +250,41 @@ class SubscriptionPanel(QFrame):
     
     def _apply_styles(self):
         """应用样式"""
-        self.setStyleSheet("""
-            #subscription_panel {
-                background-color: rgba(30, 30, 50, 0.6);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }
-            
-            #panel_title {
-                color: rgba(255, 255, 255, 0.95);
-                padding-bottom: 10px;
-            }
-            
-            #field_label {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-            }
-            
-            #url_input {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 10px;
-                padding: 12px 15px;
-                color: white;
-                font-size: 13px;
-            }
-            
-            #url_input:focus {
-                border: 1px solid rgba(120, 0, 255, 0.5);
-                background: rgba(255, 255, 255, 0.12);
-            }
-            
-            #refresh_btn {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(120, 0, 255, 0.7),
-                    stop:1 rgba(0, 212, 255, 0.7)
-                );
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            
-            #refresh_btn:hover {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(140, 20, 255, 0.9),
-                    stop:1 rgba(20, 232, 255, 0.9)
-                );
-            }
-            
-            #refresh_btn:disabled {
-                background: rgba(100, 100, 100, 0.5);
-            }
-            
-            #progress_bar {
-                background: rgba(255, 255, 255, 0.1);
-                border: none;
-                border-radius: 2px;
-            }
-            
-            #progress_bar::chunk {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #7800ff,
-                    stop:1 #00d4ff
-                );
-                border-radius: 2px;
-            }
-            
-            #status_label {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-            }
-            
-            #stat_card {
-                background: rgba(40, 40, 60, 0.5);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-            }
-            
-            #stat_value {
-                color: rgba(255, 255, 255, 0.95);
-            }
-            
-            #stat_label {
-                color: rgba(255, 255, 255, 0.6);
-                font-size: 11px;
-            }
-        """)
+        self.setStyleSheet(_SUBSCRIPTION_PANEL_QSS)
     
-    def _add_shadow(self):
-        """添加阴影"""
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
+    def _on_url_text_changed(self, text: str):
+        """地址输入变化：只有去除空白后的地址真正改变才启动防抖"""
+        url = text.strip()
+        if url != self._url:
+            self._url = url
+            self._url_timer.start()
+    
+    def _emit_url_changed(self):
+        """防抖结束：地址与上次发出的不同才发出 url_changed（输入后又改回原地址不发出）"""
+        if self._url != self._last_emitted_url:
+            self._last_emitted_url = self._url
+            self.url_changed.emit(self._url)
     
     def _on_refresh(self):
         """刷新按钮点击"""
-        url = self.url_input.text().strip()
+        url = self._url
         if url:
             self.refresh_requested.emit(url)
     
     def set_url(self, url: str):
-        """设置订阅 URL"""
-        self.url_input.setText(url)
+        """设置订阅 URL（屏蔽输入框信号，程序设置的地址不再触发 url_changed）"""
+        blocker = QSignalBlocker(self.url_input)
+        try:
+            self.url_input.setText(url)
+        finally:
+            blocker.unblock()
+        # 程序设置的地址覆盖尚未发出的输入
+        self._url_timer.stop()
+        self._url = self._last_emitted_url = url.strip()
     
     def get_url(self) -> str:
-        """获取订阅 URL"""
-        return self.url_input.text().strip()
+        """获取订阅 URL（输入变化时已去除首尾空白）"""
+        return self._url
     
     def set_loading(self, loading: bool):
         """设置加载状态"""
@@ -260,10 +298,7 @@ class SubscriptionPanel(QFrame):
     def set_status(self, message: str, is_error: bool = False):
         """设置状态信息"""
         self.status_label.setText(message)
-        if is_error:
-            self.status_label.setStyleSheet("color: rgba(255, 100, 100, 0.9);")
-        else:
-            self.status_label.setStyleSheet("color: rgba(100, 255, 150, 0.9);")
+        self.status_label.setStyleSheet(_STATUS_ERROR_QSS if is_error else _STATUS_OK_QSS)
     
     def update_stats(self, total: int, valid: int, last_update: str):
         """更新统计信息"""
@@ -1,9 +1,44 @@
 """
 设置管理器 - 用户配置持久化
 """
+import copy
 import json
 import os
-from typing import Any, Dict
+import threading
+from collections import ChainMap
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    # 可选依赖，未安装时使用标准库 json
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """解析 JSON（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj: Any) -> bytes:
+    """序列化为缩进 2 空格的 UTF-8 JSON（优先使用 orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _setting_property(key: str, default: Any) -> property:
+    """生成读写某个设置项的属性"""
+    def getter(self: 'SettingsManager') -> Any:
+        return self._settings.get(key, default)
+    
+    def setter(self: 'SettingsManager', value: Any) -> None:
+        self.set(key, value)
+    
+    return property(getter, setter, doc=f"设置项 {key}")
 
 
 class SettingsManager:
@@ -27,6 +62,9 @@ class SettingsManager:
         }
     }
     
+    # 自动保存的合并延迟（秒）：连续 set/update 只在停顿后写一次文件
+    SAVE_DELAY = 0.2
+    
     def __init__(self, config_path: str = "config/settings.json"):
         """
         初始化设置管理器
@@ -35,8 +73,29 @@ class SettingsManager:
             config_path: 配置文件路径
         """
         self.config_path = config_path
-        self._settings: Dict[str, Any] = {}
-        self._loaded = False
+        # 用户设置叠加在默认设置之上：读取时未设置的项直接回退到默认值，写入只落在用户设置中
+        self._user_settings: Dict[str, Any] = {}
+        self._settings: ChainMap = ChainMap(self._user_settings, self.DEFAULT_SETTINGS)
+        self._mtime: Optional[int] = None  # 上次读取/写入时配置文件的修改时间（None 表示文件不存在）
+        
+        # 延迟保存状态（定时器在后台线程触发，读写共享状态需加锁）
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        
+        # 构造时即读取配置文件，之后的读写无需再检查是否已加载
+        self.load()
+    
+    @classmethod
+    def defaults(cls) -> Dict[str, Any]:
+        """
+        获取默认设置
+        
+        Returns:
+            默认设置字典副本（不读取配置文件）
+        """
+        return copy.deepcopy(cls.DEFAULT_SETTINGS)
     
     def _ensure_directory(self) -> None:
         """确保配置目录存在"""
@@ -44,34 +103,45 @@ class SettingsManager:
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
     
+    def _file_mtime(self) -> Optional[int]:
+        """获取配置文件的修改时间，文件不存在时返回 None"""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def load(self) -> Dict[str, Any]:
         """
-        加载设置
+        加载设置（配置文件未变化时直接返回内存中的设置）
         
         Returns:
             设置字典
         """
+        mtime = self._file_mtime()
+        if mtime == self._mtime:
+            return dict(self._settings)
+        self._mtime = mtime
+        
+        loaded: Dict[str, Any] = {}
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded = json.load(f)
-                    # 合并默认设置和加载的设置
-                    self._settings = {**self.DEFAULT_SETTINGS, **loaded}
-            else:
-                self._settings = self.DEFAULT_SETTINGS.copy()
-            
-            self._loaded = True
-            return self._settings.copy()
-            
-        except json.JSONDecodeError:
-            # 配置文件损坏，使用默认值
-            self._settings = self.DEFAULT_SETTINGS.copy()
-            self._loaded = True
-            return self._settings.copy()
+            if mtime is not None:
+                with open(self.config_path, 'rb') as f:
+                    loaded = _loads(f.read())
         except Exception:
-            self._settings = self.DEFAULT_SETTINGS.copy()
-            self._loaded = True
-            return self._settings.copy()
+            # 配置文件损坏或无法读取，使用默认值
+            loaded = {}
+        if not isinstance(loaded, dict):
+            loaded = {}
+        
+        # 嵌套的窗口位置按字段合并，文件中缺失的字段回退到默认值
+        geometry = loaded.get("window_geometry")
+        if isinstance(geometry, dict):
+            loaded["window_geometry"] = {**self.DEFAULT_SETTINGS["window_geometry"], **geometry}
+        
+        with self._lock:
+            self._user_settings = loaded
+            self._settings = ChainMap(loaded, self.DEFAULT_SETTINGS)
+        return dict(self._settings)
     
     def save(self) -> bool:
         """
@@ -80,13 +150,76 @@ class SettingsManager:
         Returns:
             是否保存成功
         """
+        with self._lock:
+            data = _dumps(dict(self._settings))
+            # 先写临时文件并落盘，再原子替换，写入中途崩溃不会留下半个配置文件
+            # （临时文件路径固定，写入过程也在锁内，避免并发保存互相覆盖）
+            tmp_path = self.config_path + ".tmp"
+            try:
+                self._ensure_directory()
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_path)
+                # 写入成功后才清除未保存标记，失败时保留，下次 flush 或自动保存会重试
+                self._dirty = False
+                # 自己写入的内容与内存一致，记录修改时间避免下次 load 重新读取
+                self._mtime = self._file_mtime()
+                return True
+            except Exception:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                return False
+    
+    def _schedule_save(self) -> None:
+        """标记有未保存的修改，并在 SAVE_DELAY 后合并写入（批量更新期间等到结束时写入）"""
+        with self._lock:
+            self._dirty = True
+            if self._batch_depth or self._save_timer is not None:
+                return
+            # 非守护线程：进程退出前会等待定时器触发，修改不会丢失
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """
+        立即写入尚未保存的修改
+        
+        Returns:
+            是否保存成功（没有未保存的修改时返回 True）
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return True
+            return self.save()
+    
+    @contextmanager
+    def batch(self) -> Iterator['SettingsManager']:
+        """
+        批量修改设置，期间的自动保存合并为退出时的一次写入
+        
+        用法::
+        
+            with settings.batch():
+                settings.start_port = 41000
+                settings.port_count = 30
+        """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            self._ensure_directory()
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
-            return True
-        except Exception:
-            return False
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                done = self._batch_depth == 0
+            if done:
+                self.flush()
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -99,8 +232,6 @@ class SettingsManager:
         Returns:
             设置值
         """
-        if not self._loaded:
-            self.load()
         return self._settings.get(key, default)
     
     def set(self, key: str, value: Any, auto_save: bool = True) -> None:
@@ -110,13 +241,12 @@ class SettingsManager:
         Args:
             key: 设置键
             value: 设置值
-            auto_save: 是否自动保存
+            auto_save: 是否自动保存（延迟 SAVE_DELAY 秒合并写入）
         """
-        if not self._loaded:
-            self.load()
-        self._settings[key] = value
+        with self._lock:
+            self._settings[key] = value
         if auto_save:
-            self.save()
+            self._schedule_save()
     
     def get_all(self) -> Dict[str, Any]:
         """
@@ -125,13 +255,12 @@ class SettingsManager:
         Returns:
             设置字典副本
         """
-        if not self._loaded:
-            self.load()
-        return self._settings.copy()
+        return dict(self._settings)
     
     def reset_to_defaults(self) -> None:
         """重置为默认设置"""
-        self._settings = self.DEFAULT_SETTINGS.copy()
+        with self._lock:
+            self._user_settings.clear()
         self.save()
     
     def update(self, settings: Dict[str, Any], auto_save: bool = True) -> None:
@@ -140,83 +269,20 @@ class SettingsManager:
         
         Args:
             settings: 设置字典
-            auto_save: 是否自动保存
+            auto_save: 是否自动保存（延迟 SAVE_DELAY 秒合并写入）
         """
-        if not self._loaded:
-            self.load()
-        self._settings.update(settings)
+        with self._lock:
+            self._settings.update(settings)
         if auto_save:
-            self.save()
-    
-    # 便捷属性访问
-    @property
-    def subscription_url(self) -> str:
-        return self.get("subscription_url", "")
-    
-    @subscription_url.setter
-    def subscription_url(self, value: str):
-        self.set("subscription_url", value)
-    
-    @property
-    def start_port(self) -> int:
-        return self.get("start_port", 40000)
-    
-    @start_port.setter
-    def start_port(self, value: int):
-        self.set("start_port", value)
-    
-    @property
-    def port_count(self) -> int:
-        return self.get("port_count", 20)
-    
-    @port_count.setter
-    def port_count(self, value: int):
-        self.set("port_count", value)
-    
-    @property
-    def exclude_keywords(self) -> str:
-        return self.get("exclude_keywords", "")
-    
-    @exclude_keywords.setter
-    def exclude_keywords(self, value: str):
-        self.set("exclude_keywords", value)
-    
-    @property
-    def region_priority(self) -> str:
-        return self.get("region_priority", "美国,日本,香港")
-    
-    @region_priority.setter
-    def region_priority(self, value: str):
-        self.set("region_priority", value)
-    
-    @property
-    def auto_refresh_enabled(self) -> bool:
-        return self.get("auto_refresh_enabled", False)
-    
-    @auto_refresh_enabled.setter
-    def auto_refresh_enabled(self, value: bool):
-        self.set("auto_refresh_enabled", value)
-    
-    @property
-    def auto_refresh_interval(self) -> int:
-        return self.get("auto_refresh_interval", 30)
-    
-    @auto_refresh_interval.setter
-    def auto_refresh_interval(self, value: int):
-        self.set("auto_refresh_interval", value)
-    
-    @property
-    def startup_enabled(self) -> bool:
-        return self.get("startup_enabled", False)
-    
-    @startup_enabled.setter
-    def startup_enabled(self, value: bool):
-        self.set("startup_enabled", value)
-    
-    @property
-    def minimize_on_close(self) -> bool:
-        return self.get("minimize_on_close", True)
+            self._schedule_save()
     
-    @minimize_on_close.setter
-    def minimize_on_close(self, value: bool):
-        self.set("minimize_on_close", value)
+    # 便捷属性访问（读取时直接查设置字典，写入时走 set 自动保存）
+    subscription_url = _setting_property("subscription_url", "")
+    start_port = _setting_property("start_port", 40000)
+    port_count = _setting_property("port_count", 20)
+    exclude_keywords = _setting_property("exclude_keywords", "")
+    region_priority = _setting_property("region_priority", "美国,日本,香港")
+    auto_refresh_enabled = _setting_property("auto_refresh_enabled", False)
+    auto_refresh_interval = _setting_property("auto_refresh_interval", 30)
+    startup_enabled = _setting_property("startup_enabled", False)
+    minimize_on_close = _setting_property("minimize_on_close", True)
@@ -4,7 +4,7 @@
 import os
 import sys
 import winreg
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
 class StartupManager:
@@ -23,6 +23,7 @@ class StartupManager:
         """
         self.app_name = app_name or self.APP_NAME
         self.app_path = app_path or self._get_default_path()
+        self._key = None  # Run 键句柄，首次使用时打开，重复查询时复用
     
     def _get_default_path(self) -> str:
         """获取默认应用路径"""
@@ -42,6 +43,50 @@ class StartupManager:
             # 可执行文件
             return f'"{self.app_path}" --minimized'
     
+    def _get_key(self):
+        """获取 Run 键句柄（读写权限，首次使用时打开并保持）"""
+        if self._key is None:
+            self._key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                self.REGISTRY_PATH,
+                0,
+                winreg.KEY_READ | winreg.KEY_SET_VALUE
+            )
+        return self._key
+    
+    def _with_key(self, action: Callable[[Any], Any]) -> Any:
+        """在 Run 键上执行操作，句柄失效时重新打开并重试一次"""
+        try:
+            return action(self._get_key())
+        except FileNotFoundError:
+            raise
+        except OSError:
+            self.close()
+            return action(self._get_key())
+    
+    def _query_value(self) -> Optional[str]:
+        """读取本应用启动项的值，未注册返回 None"""
+        def query(key):
+            try:
+                value, _ = winreg.QueryValueEx(key, self.app_name)
+                return value
+            except FileNotFoundError:
+                return None
+        
+        return self._with_key(query)
+    
+    def close(self) -> None:
+        """关闭缓存的注册表句柄"""
+        if self._key is not None:
+            try:
+                self._key.Close()
+            except OSError:
+                pass
+            self._key = None
+    
+    def __del__(self):
+        self.close()
+    
     def enable(self) -> bool:
         """
         启用开机自启
@@ -50,22 +95,13 @@ class StartupManager:
             是否成功
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REGISTRY_PATH,
-                0,
-                winreg.KEY_SET_VALUE
-            )
-            
-            winreg.SetValueEx(
+            self._with_key(lambda key: winreg.SetValueEx(
                 key,
                 self.app_name,
                 0,
                 winreg.REG_SZ,
                 self._get_startup_command()
-            )
-            
-            winreg.CloseKey(key)
+            ))
             return True
             
         except Exception:
@@ -78,21 +114,15 @@ class StartupManager:
         Returns:
             是否成功
         """
-        try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REGISTRY_PATH,
-                0,
-                winreg.KEY_SET_VALUE
-            )
-            
+        def delete(key):
             try:
                 winreg.DeleteValue(key, self.app_name)
             except FileNotFoundError:
                 # 键不存在，视为成功
                 pass
-            
-            winreg.CloseKey(key)
+        
+        try:
+            self._with_key(delete)
             return True
             
         except Exception:
@@ -106,21 +136,7 @@ class StartupManager:
             是否已启用
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REGISTRY_PATH,
-                0,
-                winreg.KEY_READ
-            )
-            
-            try:
-                value, _ = winreg.QueryValueEx(key, self.app_name)
-                winreg.CloseKey(key)
-                return bool(value)
-            except FileNotFoundError:
-                winreg.CloseKey(key)
-                return False
-                
+            return bool(self._query_value())
         except Exception:
             return False
     
@@ -132,21 +148,7 @@ class StartupManager:
             启动路径，未注册返回 None
         """
         try:
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                self.REGISTRY_PATH,
-                0,
-                winreg.KEY_READ
-            )
-            
-            try:
-                value, _ = winreg.QueryValueEx(key, self.app_name)
-                winreg.CloseKey(key)
-                return value
-            except FileNotFoundError:
-                winreg.CloseKey(key)
-                return None
-                
+            return self._query_value()
         except Exception:
             return None
     
@@ -1,9 +1,11 @@
 """
 系统托盘管理
 """
+from typing import Optional
+
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush, QPen
-from PyQt6.QtCore import pyqtSignal, QObject, QSize
+from PyQt6.QtGui import QCursor, QIcon, QImage, QPixmap, QPixmapCache, QPainter, QColor, QBrush, QPen
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QSize
 
 
 class TrayIcon(QObject):
@@ -15,28 +17,57 @@ class TrayIcon(QObject):
     start_requested = pyqtSignal()
     stop_requested = pyqtSignal()
     
+    # 图标按 64x64 设计，实际绘制为托盘常用的几个尺寸（系统托盘一般只显示 16~32 像素）
+    ICON_DESIGN_SIZE = 64
+    ICON_SIZES = (16, 22, 32)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self._is_running = False
         self._tray = QSystemTrayIcon(parent)
         
-        self._setup_icon()
-        self._setup_menu()
-        self._connect_signals()
-    
-    def _setup_icon(self):
-        """设置图标"""
+        # 图标只有运行中/已停止两种，构造时各绘制一次，切换状态时直接复用
+        self._icons = {running: self._create_icon(running) for running in (True, False)}
+        self._tooltips = {
+            True: "Xray GUI Manager - 运行中",
+            False: "Xray GUI Manager - 已停止",
+        }
+        
+        # 右键菜单在第一次右键点击时才创建，启动时不构建菜单和解析样式
+        self._menu: Optional[QMenu] = None
+        
         self._update_icon()
+        self._connect_signals()
     
     def _create_icon(self, running: bool) -> QIcon:
-        """创建托盘图标"""
-        size = 64
-        pixmap = QPixmap(size, size)
-        pixmap.fill(QColor(0, 0, 0, 0))
-        
-        painter = QPainter(pixmap)
+        """创建托盘图标（按常见托盘尺寸分别绘制，系统按需选用，无需缩放大图）"""
+        # 高分屏按设备像素绘制，避免系统再放大小图
+        ratio = QApplication.instance().devicePixelRatio()
+        icon = QIcon()
+        for size in self.ICON_SIZES:
+            icon.addPixmap(self._render_icon(running, size, ratio))
+        return icon
+    
+    def _render_icon(self, running: bool, size: int, ratio: float = 1.0) -> QPixmap:
+        """绘制指定尺寸的图标（绘制结果放入全局 QPixmapCache，进程内多个托盘实例共用）"""
+        pixel_size = round(size * ratio)
+        key = f"xray-tray-{running}-{size}@{ratio}"  # 缩放比写入 QPixmap，需一并作为键
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
+        # 在 QImage 上绘制（纯 CPU 光栅化，不经过窗口系统），最后一次性转换为 QPixmap；
+        # 预乘 ARGB32 是光栅引擎的原生格式，转换时无需再做格式转换
+        image = QImage(pixel_size, pixel_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # 下面的坐标按 ICON_DESIGN_SIZE 设计，缩放到目标像素尺寸
+        scale = pixel_size / self.ICON_DESIGN_SIZE
+        painter.scale(scale, scale)
+        design = self.ICON_DESIGN_SIZE
         
         # 背景圆
         if running:
@@ -48,26 +79,25 @@ class TrayIcon(QObject):
         
         painter.setBrush(QBrush(gradient_color))
         painter.setPen(QPen(QColor(255, 255, 255, 100), 2))
-        painter.drawEllipse(4, 4, size - 8, size - 8)
+        painter.drawEllipse(4, 4, design - 8, design - 8)
         
         # 中心图标 (X 形状代表 Xray)
         painter.setPen(QPen(QColor(255, 255, 255), 4))
         margin = 18
-        painter.drawLine(margin, margin, size - margin, size - margin)
-        painter.drawLine(size - margin, margin, margin, size - margin)
+        painter.drawLine(margin, margin, design - margin, design - margin)
+        painter.drawLine(design - margin, margin, margin, design - margin)
         
         painter.end()
         
-        return QIcon(pixmap)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(ratio)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
     
     def _update_icon(self):
-        """更新图标"""
-        icon = self._create_icon(self._is_running)
-        self._tray.setIcon(icon)
-        
-        # 更新提示文字
-        status = "运行中" if self._is_running else "已停止"
-        self._tray.setToolTip(f"Xray GUI Manager - {status}")
+        """更新图标和提示文字"""
+        self._tray.setIcon(self._icons[self._is_running])
+        self._tray.setToolTip(self._tooltips[self._is_running])
     
     def _setup_menu(self):
         """设置右键菜单"""
@@ -106,7 +136,8 @@ class TrayIcon(QObject):
         
         self._stop_action = self._menu.addAction("■ 停止服务")
         self._stop_action.triggered.connect(self.stop_requested.emit)
-        self._stop_action.setEnabled(False)
+        self._start_action.setEnabled(not self._is_running)
+        self._stop_action.setEnabled(self._is_running)
         
         self._menu.addSeparator()
         
@@ -124,6 +155,10 @@ class TrayIcon(QObject):
         """托盘图标激活"""
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_requested.emit()
+        elif reason == QSystemTrayIcon.ActivationReason.Context and self._menu is None:
+            # 第一次右键：创建菜单并手动弹出，之后由托盘直接显示已设置的菜单
+            self._setup_menu()
+            self._menu.popup(QCursor.pos())
     
     def show(self):
         """显示托盘图标"""
@@ -138,9 +173,10 @@ class TrayIcon(QObject):
         self._is_running = running
         self._update_icon()
         
-        # 更新菜单状态
-        self._start_action.setEnabled(not running)
-        self._stop_action.setEnabled(running)
+        # 更新菜单状态（菜单尚未创建时，创建时按当前状态设置）
+        if self._menu is not None:
+            self._start_action.setEnabled(not running)
+            self._stop_action.setEnabled(running)
     
     def show_message(self, title: str, message: str, icon: QSystemTrayIcon.MessageIcon = QSystemTrayIcon.MessageIcon.Information):
         """显示通知消息"""
@@ -719,8 +719,7 @@ class MainWindow(QMainWindow):
         self._xray = None
         
         self.settings: Dict = {}
-        self.settings_dlg = SettingsDialog(self)
-        self.settings_dlg.saved.connect(self._on_settings_saved)
+        self._settings_dlg = None  # 首次打开设置时创建
         
         # 主题切换回调
         ThemeManager.add_callback(self._on_theme_changed)
@@ -801,6 +800,14 @@ class MainWindow(QMainWindow):
         QApplication.quit()
     
     # 延迟初始化
+    @property
+    def settings_dlg(self):
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self)
+            self._settings_dlg.saved.connect(self._on_settings_saved)
+            self._settings_dlg.set_data(self.settings)
+        return self._settings_dlg
+    
     @property
     def subscription(self):
         if not self._subscription:
@@ -1186,7 +1193,8 @@ class MainWindow(QMainWindow):
     
     def _on_theme_changed(self):
         self._apply_style()
-        self.settings_dlg._apply_style()
+        if self._settings_dlg is not None:
+            self._settings_dlg._apply_style()
     
     # ========== 窗口拖拽 ==========
     def mousePressEvent(self, event):
@@ -1283,7 +1291,8 @@ class MainWindow(QMainWindow):
         else:
             self.settings = {'exclude': DEFAULT_EXCLUDE}
         
-        self.settings_dlg.set_data(self.settings)
+        if self._settings_dlg is not None:
+            self._settings_dlg.set_data(self.settings)
     
     def _save_state(self):
         nodes_data = [{